@@ -30,13 +30,34 @@ Usage:
 
 import logging
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 
 # Configure logging to be secure (no sensitive data)
 logger = logging.getLogger(__name__)
 
+# Files/directories never read or descended into (plus anything starting with '.env')
+SENSITIVE_NAMES = frozenset({'.env', '.git', '__pycache__', '.venv', 'venv',
+                             'node_modules', '.pytest_cache', '.mypy_cache'})
+
+
+# Documentation file suffixes (lowercase) and the type reported for each
+DOC_TYPES = {'.md': 'MD', '.rst': 'RST', '.txt': 'TXT', '.adoc': 'ADOC'}
+
+# Keywords that mark a markdown file as agent-related, matched in one pass over its opening text
+AGENT_CONTENT_KEYWORDS = ('copilot', 'ai agent', 'agent:', 'prompt')
+_AGENT_CONTENT_RE = re.compile('|'.join(re.escape(keyword) for keyword in AGENT_CONTENT_KEYWORDS))
+
+# Characters of a markdown file inspected for agent keywords
+AGENT_CONTENT_PREVIEW_CHARS = 200
+
+
+def _is_sensitive_name(name: str) -> bool:
+    """Check if a single path component names a sensitive file or directory."""
+    return name in SENSITIVE_NAMES or name.startswith('.env')
+
 
 def _is_safe_path(path: Path, root: Path) -> bool:
     """
@@ -49,6 +70,12 @@ def _is_safe_path(path: Path, root: Path) -> bool:
     Returns:
         True if path is safe to read, False otherwise
     """
+    # Reject sensitive names as written before touching the filesystem; a
+    # name like '.env' or '.git' is refused even if a symlink would resolve
+    # it somewhere harmless
+    if any(_is_sensitive_name(part) for part in path.parts):
+        return False
+
     try:
         # Resolve to absolute path and check if within root
         abs_path = path.resolve()
@@ -59,11 +86,8 @@ def _is_safe_path(path: Path, root: Path) -> bool:
             return False
 
         # Skip sensitive files/directories
-        sensitive_patterns = {'.env', '.git', '__pycache__', '.venv', 'venv',
-                              'node_modules', '.pytest_cache', '.mypy_cache'}
-
         for part in abs_path.parts:
-            if part in sensitive_patterns or part.startswith('.env'):
+            if _is_sensitive_name(part):
                 return False
 
         return True
@@ -71,6 +95,53 @@ def _is_safe_path(path: Path, root: Path) -> bool:
         return False
 
 
+def _iter_files(directory: Path, recursive: bool) -> Iterator[os.DirEntry]:
+    """
+    Yield file entries under a directory using os.scandir.
+
+    DirEntry caches file type (and, off Windows, stat) information from the
+    directory listing, so walking costs far fewer stat calls than
+    Path.rglob() + is_file(). Symlinked directories are not followed and
+    sensitive directories are pruned rather than walked and filtered.
+    A subdirectory that cannot be listed is logged and skipped; only an
+    unreadable top-level directory raises.
+
+    Args:
+        directory: Directory to scan
+        recursive: Descend into subdirectories if True, else direct children only
+
+    Yields:
+        os.DirEntry for each file found
+
+    Raises:
+        OSError: If directory itself cannot be listed
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not _is_sensitive_name(entry.name):
+                    try:
+                        yield from _iter_files(entry.path, recursive)
+                    except OSError as e:
+                        logger.warning(f"Could not read path {entry.path}: {e}")
+            elif entry.is_file():
+                yield entry
+
+
+def _scan_names(directory: Path) -> Dict[str, os.DirEntry]:
+    """
+    List a directory once, mapping entry names to their DirEntry.
+
+    Returns an empty dict if the directory is missing or unreadable, so
+    membership tests replace individual exists() calls.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
 def list_docs(root: Path) -> Dict[str, Any]:
     """
     Discover documentation files in the repository.
@@ -105,35 +176,31 @@ def list_docs(root: Path) -> Dict[str, Any]:
         root,  # Root level markdown files
     ]
 
-    # Documentation file patterns
-    doc_extensions = {'.md', '.rst', '.txt', '.adoc'}
-
     for search_path in search_paths:
         if not search_path.exists() or not _is_safe_path(search_path, root):
             continue
 
         try:
-            # For root, only check direct children
-            if search_path == root:
-                files = [f for f in search_path.iterdir() if f.is_file()]
-            else:
-                # For subdirectories, search recursively
-                files = list(search_path.rglob('*'))
-
-            for file_path in files:
-                if not file_path.is_file() or not _is_safe_path(file_path, root):
+            # For root, only check direct children; search subdirectories recursively
+            for entry in _iter_files(search_path, recursive=search_path != root):
+                # Classify by name first; only documentation files get a Path
+                doc_type = DOC_TYPES.get(os.path.splitext(entry.name)[1].lower())
+                if doc_type is None:
                     continue
 
-                if file_path.suffix.lower() in doc_extensions:
-                    relative_path = file_path.relative_to(root)
-                    doc_dirs.add(str(relative_path.parent))
+                file_path = Path(entry.path)
+                if not _is_safe_path(file_path, root):
+                    continue
 
-                    docs_list.append({
-                        'name': file_path.name,
-                        'path': str(relative_path),
-                        'type': file_path.suffix.lstrip('.').upper(),
-                        'size_bytes': file_path.stat().st_size,
-                    })
+                relative_path = file_path.relative_to(root)
+                doc_dirs.add(str(relative_path.parent))
+
+                docs_list.append({
+                    'name': entry.name,
+                    'path': str(relative_path),
+                    'type': doc_type,
+                    'size_bytes': entry.stat().st_size,
+                })
 
         except (OSError, PermissionError) as e:
             logger.warning(f"Could not read path {search_path}: {e}")
@@ -199,14 +266,9 @@ def show_agent_prompts(root: Path) -> Dict[str, Any]:
             continue
 
         try:
-            # For root, only check direct children
-            if search_path == root:
-                files = [f for f in search_path.iterdir() if f.is_file()]
-            else:
-                # For subdirectories, search recursively
-                files = [f for f in search_path.rglob('*') if f.is_file()]
-
-            for file_path in files:
+            # For root, only check direct children; search subdirectories recursively
+            for entry in _iter_files(search_path, recursive=search_path != root):
+                file_path = Path(entry.path)
                 if not _is_safe_path(file_path, root):
                     continue
 
@@ -223,8 +285,10 @@ def show_agent_prompts(root: Path) -> Dict[str, Any]:
                 # Also check for AI/agent related markdown files
                 if file_path.suffix.lower() == '.md' and not is_agent_file:
                     try:
-                        content_preview = file_path.read_text(encoding='utf-8', errors='ignore')[:200].lower()
-                        if any(keyword in content_preview for keyword in ['copilot', 'ai agent', 'agent:', 'prompt']):
+                        # Read only the preview instead of the whole file
+                        with open(file_path, encoding='utf-8', errors='ignore') as f:
+                            content_preview = f.read(AGENT_CONTENT_PREVIEW_CHARS).lower()
+                        if _AGENT_CONTENT_RE.search(content_preview):
                             is_agent_file = True
                     except (OSError, UnicodeDecodeError):
                         pass
@@ -237,7 +301,7 @@ def show_agent_prompts(root: Path) -> Dict[str, Any]:
                         'name': file_path.name,
                         'path': str(relative_path),
                         'type': 'Agent Configuration' if 'config' in name_lower else 'Agent Instructions',
-                        'size_bytes': file_path.stat().st_size,
+                        'size_bytes': entry.stat().st_size,
                     })
 
         except (OSError, PermissionError) as e:
@@ -289,21 +353,24 @@ def check_workspace(root: Path) -> Dict[str, Any]:
     checks: List[Dict[str, Any]] = []
     recommendations: List[str] = []
 
+    # One directory listing answers every top-level existence probe below
+    top_level = _scan_names(root)
+
     # Check 1: Git repository
-    git_dir = root / '.git'
+    has_git = '.git' in top_level
     git_check = {
         'name': 'Git Repository',
-        'status': 'pass' if git_dir.exists() else 'fail',
-        'message': 'Valid git repository' if git_dir.exists() else 'Not a git repository',
+        'status': 'pass' if has_git else 'fail',
+        'message': 'Valid git repository' if has_git else 'Not a git repository',
     }
     checks.append(git_check)
 
-    if not git_dir.exists():
+    if not has_git:
         recommendations.append('Initialize git repository: git init')
 
     # Check 2: Python requirements files
     req_files = ['requirements.txt', 'requirements-dev.txt', 'requirements-extensions.txt']
-    found_reqs = [f for f in req_files if (root / f).exists()]
+    found_reqs = [f for f in req_files if f in top_level]
 
     req_check = {
         'name': 'Python Requirements',
@@ -319,7 +386,7 @@ def check_workspace(root: Path) -> Dict[str, Any]:
 
     # Check 3: Key directories
     key_dirs = ['scripts', 'tests', 'docs', 'src', '.github']
-    found_dirs = [d for d in key_dirs if (root / d).exists() and (root / d).is_dir()]
+    found_dirs = [d for d in key_dirs if d in top_level and top_level[d].is_dir()]
 
     dir_check = {
         'name': 'Repository Structure',
@@ -331,7 +398,7 @@ def check_workspace(root: Path) -> Dict[str, Any]:
 
     # Check 4: Python environment
     venv_paths = ['.venv', 'venv', '.env']
-    has_venv = any((root / vp).exists() for vp in venv_paths)
+    has_venv = any(vp in top_level for vp in venv_paths)
 
     python_check = {
         'name': 'Python Environment',
@@ -345,7 +412,7 @@ def check_workspace(root: Path) -> Dict[str, Any]:
 
     # Check 5: Configuration files
     config_files = ['pyproject.toml', 'setup.py', 'setup.cfg', '.flake8', '.bandit']
-    found_configs = [cf for cf in config_files if (root / cf).exists()]
+    found_configs = [cf for cf in config_files if cf in top_level]
 
     config_check = {
         'name': 'Configuration Files',
@@ -357,10 +424,12 @@ def check_workspace(root: Path) -> Dict[str, Any]:
     checks.append(config_check)
 
     # Check 6: CI/CD workflows
-    workflows_dir = root / '.github' / 'workflows'
     workflow_files = []
-    if workflows_dir.exists():
-        workflow_files = [f.name for f in workflows_dir.glob('*.yml') if f.is_file()]
+    if '.github' in top_level:
+        workflows = _scan_names(root / '.github' / 'workflows')
+        workflow_files = [
+            name for name, entry in workflows.items() if name.endswith(('.yml', '.yaml')) and entry.is_file()
+        ]
 
     ci_check = {
         'name': 'CI/CD Workflows',
@@ -31,6 +31,18 @@ from pathlib import Path
 from scripts.copilot_tools import list_docs, show_agent_prompts, check_workspace
 
 
+def dumps_output(obj, pretty: bool = False) -> str:
+    """
+    Serialize CLI output as JSON.
+
+    Machine-readable output (the default) uses compact separators, which
+    skips emitting and later parsing the padding spaces; --pretty indents.
+    """
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
 def find_repo_root() -> Path:
     """
     Find the repository root by looking for .git directory.
@@ -98,14 +110,14 @@ Examples:
         root = args.root.resolve() if args.root else find_repo_root()
 
         if not root.exists():
-            print(json.dumps({
+            print(dumps_output({
                 'error': 'Repository root does not exist',
                 'path': str(root)
             }), file=sys.stderr)
             return 1
 
     except Exception as e:
-        print(json.dumps({
+        print(dumps_output({
             'error': 'Failed to determine repository root',
             'message': str(e)
         }), file=sys.stderr)
@@ -121,18 +133,17 @@ Examples:
             result = check_workspace(root)
         else:
             # Should not happen due to argparse choices
-            print(json.dumps({
+            print(dumps_output({
                 'error': f'Unknown command: {args.command}'
             }), file=sys.stderr)
             return 1
 
         # Output result as JSON
-        indent = 2 if args.pretty else None
-        print(json.dumps(result, indent=indent))
+        print(dumps_output(result, pretty=args.pretty))
         return 0
 
     except Exception as e:
-        print(json.dumps({
+        print(dumps_output({
             'error': f'Command failed: {args.command}',
             'message': str(e),
             'type': type(e).__name__
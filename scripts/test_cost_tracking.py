@@ -279,7 +279,7 @@ def main():
 
         print("\n✅ All demos completed successfully!")
         print("\n📚 Next Steps:")
-        print("   1. Review the cost log: output/reports/gpt5_cost_log.json")
+        print("   1. Review the cost log: output/reports/gpt5_cost_log.jsonl")
         print("   2. Check CSV export: output/reports/gpt5_dev_costs.csv")
         print("   3. Import the tracker in your scripts:")
         print("      from src.core.cost_tracker import get_tracker")
@@ -14,8 +14,10 @@ import os
 from pathlib import Path
 
 from flask import Flask, jsonify
+from sqlalchemy.pool import StaticPool
 
 from src.api.auth_routes import init_auth_routes
+from src.api.models import DEFAULT_BCRYPT_ROUNDS
 
 
 def create_app(config: dict = None) -> Flask:
@@ -32,6 +34,11 @@ def create_app(config: dict = None) -> Flask:
         DATABASE_URL: Database connection string (default: sqlite:///data/users.db)
         SECRET_KEY: Flask secret key for session management
         DEBUG: Debug mode (default: False)
+        BCRYPT_ROUNDS: Bcrypt cost factor for password hashing (default: 12;
+            values below 12 are only accepted when TESTING is set)
+
+    Raises:
+        ValueError: If BCRYPT_ROUNDS is below 12 outside of TESTING
 
     Reference: #create_app - Flask application factory pattern
     """
@@ -42,6 +49,7 @@ def create_app(config: dict = None) -> Flask:
         "DATABASE_URL": os.getenv("DATABASE_URL", "sqlite:///data/users.db"),
         "SECRET_KEY": os.getenv("SECRET_KEY", "dev-secret-key-change-in-production"),
         "DEBUG": os.getenv("FLASK_DEBUG", "False").lower() == "true",
+        "BCRYPT_ROUNDS": DEFAULT_BCRYPT_ROUNDS,
     }
 
     # Merge with provided config
@@ -50,13 +58,26 @@ def create_app(config: dict = None) -> Flask:
 
     app.config.update(default_config)
 
+    # A lowered cost factor is a test-suite speedup, never a production setting
+    if not app.config.get("TESTING") and app.config["BCRYPT_ROUNDS"] < DEFAULT_BCRYPT_ROUNDS:
+        raise ValueError(
+            f"BCRYPT_ROUNDS must be at least {DEFAULT_BCRYPT_ROUNDS} outside of TESTING "
+            f"(got {app.config['BCRYPT_ROUNDS']})"
+        )
+
     # Ensure data directory exists for SQLite
     if app.config["DATABASE_URL"].startswith("sqlite:///"):
         db_path = app.config["DATABASE_URL"].replace("sqlite:///", "")
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    # In tests, share one SQLite connection across the app instead of
+    # opening and closing it per request (also keeps in-memory DBs alive)
+    engine_options = None
+    if app.config.get("TESTING") and app.config["DATABASE_URL"].startswith("sqlite:"):
+        engine_options = {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+
     # Initialize authentication routes with database
-    init_auth_routes(app, app.config["DATABASE_URL"])
+    init_auth_routes(app, app.config["DATABASE_URL"], engine_options)
 
     # Root endpoint
     @app.route("/")
@@ -8,10 +8,10 @@ Reference: #auth_routes.py - REST API endpoints for authentication
 Integration with: #models.py (User model), #validators.py (input validation)
 """
 
-from flask import Blueprint, Flask, jsonify, request
+from flask import Blueprint, Flask, current_app, jsonify, request
 from sqlalchemy.exc import IntegrityError
 
-from src.api.models import DatabaseManager, User
+from src.api.models import DEFAULT_BCRYPT_ROUNDS, DatabaseManager, User
 from src.api.validators import validate_registration_data
 
 # Create Blueprint for authentication routes
@@ -21,19 +21,24 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 db_manager = None
 
 
-def init_auth_routes(app: Flask, database_url: str = "sqlite:///data/users.db"):
+def init_auth_routes(app: Flask, database_url: str = "sqlite:///data/users.db", engine_options: dict = None):
     """
     Initialize authentication routes with database connection.
 
+    The SQLAlchemy engine is exposed as ``app.extensions["db_engine"]`` so
+    callers (e.g. test teardown) can dispose its connection pool.
+
     Args:
         app: Flask application instance
         database_url: Database connection URL
+        engine_options: Extra keyword arguments for the SQLAlchemy engine
 
     Reference: #init_auth_routes - Blueprint initialization with database
     """
     global db_manager
-    db_manager = DatabaseManager(database_url)
+    db_manager = DatabaseManager(database_url, engine_options)
     db_manager.create_tables()
+    app.extensions["db_engine"] = db_manager.engine
     app.register_blueprint(auth_bp)
 
 
@@ -81,7 +86,7 @@ def register_user():
 
     Security Features:
         - Input validation (email format, password strength)
-        - Bcrypt password hashing with salt (cost factor 12)
+        - Bcrypt password hashing with salt (cost factor from BCRYPT_ROUNDS, default 12)
         - Duplicate user detection
         - Never returns password in response
         - SQL injection protection via SQLAlchemy ORM
@@ -134,7 +139,7 @@ def register_user():
             new_user = User(username=username, email=email, full_name=full_name)
 
             # Hash password using bcrypt (Integration with #set_password method)
-            new_user.set_password(password)
+            new_user.set_password(password, rounds=current_app.config.get("BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS))
 
             # Save to database
             session.add(new_user)
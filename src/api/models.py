@@ -16,6 +16,9 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 
 Base = declarative_base()
 
+# Production bcrypt cost factor; tests may lower it via the BCRYPT_ROUNDS app config
+DEFAULT_BCRYPT_ROUNDS = 12
+
 
 # Helper function for datetime defaults
 def _utc_now():
@@ -54,22 +57,23 @@ class User(Base):
     created_at = Column(DateTime, default=_utc_now, nullable=False)
     updated_at = Column(DateTime, default=_utc_now, onupdate=_utc_now, nullable=False)
 
-    def set_password(self, password: str) -> None:
+    def set_password(self, password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> None:
         """
         Hash and set user password using bcrypt.
 
         Args:
             password: Plain text password to hash
+            rounds: Bcrypt cost factor (default: 12; only lower it in tests)
 
         Security:
             - Uses bcrypt with automatic salt generation
-            - Cost factor of 12 (balanced security/performance)
+            - Cost factor of 12 by default (balanced security/performance)
             - Never stores plain text passwords
 
         Reference: #set_password - Bcrypt password hashing implementation
         """
-        # Generate salt and hash password with cost factor 12
-        salt = bcrypt.gensalt(rounds=12)
+        # Generate salt and hash password with the configured cost factor
+        salt = bcrypt.gensalt(rounds=rounds)
         self.password_hash = bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
     def check_password(self, password: str) -> bool:
@@ -122,14 +126,15 @@ class DatabaseManager:
     Reference: #DatabaseManager - Database initialization and session management
     """
 
-    def __init__(self, database_url: str = "sqlite:///data/users.db"):
+    def __init__(self, database_url: str = "sqlite:///data/users.db", engine_options: Optional[dict] = None):
         """
         Initialize database manager.
 
         Args:
             database_url: SQLAlchemy database URL (default: SQLite in data/ directory)
+            engine_options: Extra keyword arguments for create_engine (e.g. poolclass)
         """
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = create_engine(database_url, echo=False, **(engine_options or {}))
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self) -> None:
@@ -17,13 +17,81 @@ Created: November 2025
 """
 
 import json
+import os
+from bisect import bisect_left
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.core.file_io import ensure_parent_dir
 
+# Estimated pricing (per 1M tokens) - update when official pricing released
+GPT5_PRICING = {
+    "gpt-5": {"input": 4.00, "cached_input": 2.00, "output": 12.00},
+    "gpt-5-mini": {"input": 1.50, "cached_input": 0.75, "output": 4.50},
+    "gpt-5-nano": {"input": 0.75, "cached_input": 0.375, "output": 2.25},
+}
+
+DEFAULT_LOG_FILE = "output/reports/gpt5_cost_log.jsonl"
+# Default log name from before the switch to JSON Lines; migrated on first default use
+LEGACY_DEFAULT_LOG_FILE = "output/reports/gpt5_cost_log.json"
+
+
+class _History(list):
+    """
+    Usage history list that counts edits other than appends.
+
+    append/extend only add entries at the end, which the cost index can pick
+    up incrementally. Every other mutation (item assignment, deletion,
+    insert, pop, remove, clear, sort, reverse, *=) bumps ``version`` so the
+    index knows to rebuild. Entries are treated as immutable once recorded;
+    editing an entry dict in place is not tracked.
+    """
+
+    version = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._changed()
+        return result
+
+    def insert(self, index, entry):
+        super().insert(index, entry)
+        self._changed()
+
+    def pop(self, index=-1):
+        entry = super().pop(index)
+        self._changed()
+        return entry
+
+    def remove(self, entry):
+        super().remove(entry)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
 
 class GPT5CostTracker:
     """
@@ -36,12 +104,7 @@ class GPT5CostTracker:
     - Cached input: 50% discount
     """
 
-    # Estimated pricing (per 1M tokens) - update when official pricing released
-    PRICING = {
-        "gpt-5": {"input": 4.00, "cached_input": 2.00, "output": 12.00},
-        "gpt-5-mini": {"input": 1.50, "cached_input": 0.75, "output": 4.50},
-        "gpt-5-nano": {"input": 0.75, "cached_input": 0.375, "output": 2.25},
-    }
+    PRICING = GPT5_PRICING
 
     def __init__(self, budget_limit: Optional[float] = None, log_file: Optional[str] = None, auto_save: bool = False):
         """
@@ -49,12 +112,12 @@ class GPT5CostTracker:
 
         Args:
             budget_limit: Optional daily budget limit in USD (triggers warnings)
-            log_file: Path to JSON log file for tracking usage history
+            log_file: Path to JSON Lines log file for tracking usage history (one entry per line)
             auto_save: If True, saves after every request. If False (default), call save() manually.
                       Performance optimization: Set to False for high-frequency usage.
         """
         self.budget_limit = budget_limit
-        self.log_file = log_file or "output/reports/gpt5_cost_log.json"
+        self.log_file = log_file or DEFAULT_LOG_FILE
         self.auto_save = auto_save
         self.session_costs = []
         self.total_tokens = {"input": 0, "cached_input": 0, "output": 0}
@@ -64,25 +127,124 @@ class GPT5CostTracker:
         # Load existing log
         self.log_path = Path(self.log_file)
         ensure_parent_dir(self.log_path)
-        self.history = self._load_history()
+        source = self.log_path
+        if log_file is None and not source.exists() and Path(LEGACY_DEFAULT_LOG_FILE).exists():
+            # History recorded under the old default name is carried over to the new log
+            source = Path(LEGACY_DEFAULT_LOG_FILE)
+        self.history = self._load_history(source)
         
         # Cache for parsed dates to avoid repeated parsing
         self._date_cache: Dict[str, datetime] = {}
 
-    def _load_history(self) -> List[Dict]:
-        """Load cost history from log file."""
-        if self.log_path.exists():
+        # Cost index over history: timestamps in sorted order plus running cost
+        # totals (_index_cum[i] = cost of the first i entries), so period costs
+        # are two bisects instead of a scan. See _sync_cost_index.
+        self._index_ts: List[datetime] = []
+        self._index_cum: List[float] = [0.0]
+        self._index_source: Optional[_History] = None
+        self._index_version = 0
+        self._index_len = 0
+
+    @property
+    def history(self) -> List[Dict]:
+        """Usage history entries, oldest first as recorded."""
+        return self._history
+
+    @history.setter
+    def history(self, entries: List[Dict]):
+        self._history = _History(entries)
+
+    def _load_history(self, source: Optional[Path] = None) -> List[Dict]:
+        """
+        Load cost history from log file.
+
+        The log is JSON Lines; unreadable lines (e.g. a write cut short) are
+        skipped. A legacy log holding a single JSON array is loaded and
+        rewritten as JSON Lines so later saves can append to it. If source is
+        another file (the legacy default log), its history is copied into
+        self.log_path.
+        """
+        source = source or self.log_path
+        try:
+            # Fast path: an empty log needs one stat, not an open + read + parse
+            if source.stat().st_size == 0:
+                return []
+            data = source.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        if data.lstrip().startswith(b"["):
             try:
-                with open(self.log_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
+                history = json.loads(data)
+            except json.JSONDecodeError:
+                # A legacy array cut short by an interrupted full rewrite: set it
+                # aside so new entries don't get appended after the broken array
+                self._quarantine_log(source)
                 return []
-        return []
+            self._replace_log(history)
+            return history
+
+        lines = [line for line in data.splitlines() if line.strip()]
+        try:
+            # Fast path: one json.loads over the whole log instead of one per line
+            history = json.loads(b"[" + b",".join(lines) + b"]")
+        except json.JSONDecodeError:
+            history = []
+            for line in lines:
+                try:
+                    history.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        if source != self.log_path:
+            self._replace_log(history)
+        return history
+
+    @staticmethod
+    def _quarantine_log(path: Path):
+        """Move an unreadable log aside (keeping its contents) and warn."""
+        corrupt_path = path.with_name(f"{path.name}.corrupt-{datetime.now():%Y%m%d%H%M%S}")
+        path.replace(corrupt_path)
+        print(f"⚠️  Cost log {path} could not be parsed; moved it to {corrupt_path} and started a new log")
+
+    @staticmethod
+    def _encode_lines(entries: List[Dict]) -> bytes:
+        """Serialize entries as JSON Lines."""
+        return "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+
+    def _replace_log(self, entries: List[Dict]):
+        """
+        Rewrite the whole log as JSON Lines.
+
+        Writes a temporary file next to the log and swaps it in with os.replace,
+        so an interrupted rewrite leaves the previous log intact.
+        """
+        tmp_path = self.log_path.with_name(f"{self.log_path.name}.tmp")
+        tmp_path.write_bytes(self._encode_lines(entries))
+        os.replace(tmp_path, self.log_path)
+
+    def _write_lines(self, entries: List[Dict]):
+        """Append entries to the log file as JSON Lines in a single write."""
+        payload = self._encode_lines(entries)
+        with open(self.log_path, "a+b") as f:
+            # Start on a fresh line if an earlier append was torn mid-line,
+            # so the new entries aren't glued onto the partial one
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
 
     def _save_history(self):
-        """Save cost history to log file."""
-        with open(self.log_path, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, indent=2)
+        """
+        Append unsaved entries to the log file.
+
+        Performance optimization: each save writes only the new entries
+        instead of re-serializing the whole history.
+        """
+        if self._unsaved_entries:
+            self._write_lines(self.history[-self._unsaved_entries :])
         self._unsaved_entries = 0  # Reset counter after save
     
     def save(self):
@@ -129,18 +291,13 @@ class GPT5CostTracker:
         Returns:
             Dict with cost breakdown and cumulative totals
         """
-        # Normalize model name
-        model_key = model.lower()
-        if model_key not in self.PRICING:
-            # Default to gpt-5 pricing if unknown
-            model_key = "gpt-5"
-
-        pricing = self.PRICING[model_key]
+        # Per-1M-token rates (unknown models default to gpt-5 pricing)
+        input_rate, cached_rate, output_rate = self._resolve_pricing(model)
 
         # Calculate cost
-        input_cost = (prompt_tokens / 1_000_000) * pricing["input"]
-        cached_cost = (cached_tokens / 1_000_000) * pricing["cached_input"]
-        output_cost = (completion_tokens / 1_000_000) * pricing["output"]
+        input_cost = (prompt_tokens / 1_000_000) * input_rate
+        cached_cost = (cached_tokens / 1_000_000) * cached_rate
+        output_cost = (completion_tokens / 1_000_000) * output_rate
         total_cost = input_cost + cached_cost + output_cost
 
         # Update session totals
@@ -149,9 +306,13 @@ class GPT5CostTracker:
         self.total_tokens["output"] += completion_tokens
         self.total_cost += total_cost
 
-        # Create log entry
+        # Create log entry; seed the date cache with the datetime already in
+        # hand so period cost queries never parse this timestamp back
+        now = datetime.now()
+        timestamp = now.isoformat()
+        self._date_cache[timestamp] = now
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "model": model,
             "request_type": request_type,
             "tokens": {
@@ -193,47 +354,76 @@ class GPT5CostTracker:
             },
         }
 
+    def _sync_cost_index(self):
+        """
+        Bring the sorted cost index up to date with self.history.
+
+        Entries appended in time order (the track_request case) extend the
+        index in O(1) each. Anything else - history reassigned, any other list
+        edit (see _History), or entries older than the newest indexed one -
+        rebuilds it from scratch.
+        """
+        history = self._history
+        synced = self._index_len
+        if not (history is self._index_source and history.version == self._index_version and synced <= len(history)):
+            synced = 0
+            self._index_ts = []
+            self._index_cum = [0.0]
+            self._index_source = history
+            self._index_version = history.version
+
+        if synced == len(history):
+            return
+
+        new_points = [(self._get_parsed_date(e["timestamp"]), e["cost"]["total"]) for e in history[synced:]]
+        in_order = all(a[0] <= b[0] for a, b in zip(new_points, new_points[1:]))
+        if not in_order or (self._index_ts and new_points[0][0] < self._index_ts[-1]):
+            new_points = sorted(
+                ((self._get_parsed_date(e["timestamp"]), e["cost"]["total"]) for e in history),
+                key=lambda point: point[0],
+            )
+            self._index_ts = []
+            self._index_cum = [0.0]
+
+        for timestamp, cost in new_points:
+            self._index_ts.append(timestamp)
+            self._index_cum.append(self._index_cum[-1] + cost)
+
+        self._index_len = len(history)
+
+    def _cost_between(self, start: datetime, end: Optional[datetime] = None) -> float:
+        """Total cost of history entries with start <= timestamp < end (no upper bound if end is None)."""
+        self._sync_cost_index()
+        lo = bisect_left(self._index_ts, start)
+        hi = len(self._index_ts) if end is None else bisect_left(self._index_ts, end)
+        return self._index_cum[hi] - self._index_cum[lo] if hi > lo else 0.0
+
     def get_daily_cost(self) -> float:
         """
         Get total cost for today.
-        
-        Performance optimization: Uses cached datetime parsing.
+
+        Performance optimization: Range lookup on the sorted cost index.
         """
-        today = datetime.now().date()
-        daily_cost = sum(
-            entry["cost"]["total"]
-            for entry in self.history
-            if self._get_parsed_date(entry["timestamp"]).date() == today
-        )
-        return daily_cost
+        start = datetime.combine(datetime.now().date(), time.min)
+        return self._cost_between(start, start + timedelta(days=1))
 
     def get_weekly_cost(self) -> float:
         """
         Get total cost for the past 7 days.
-        
-        Performance optimization: Uses cached datetime parsing.
+
+        Performance optimization: Range lookup on the sorted cost index.
         """
-        week_ago = datetime.now() - timedelta(days=7)
-        weekly_cost = sum(
-            entry["cost"]["total"] for entry in self.history 
-            if self._get_parsed_date(entry["timestamp"]) >= week_ago
-        )
-        return weekly_cost
+        return self._cost_between(datetime.now() - timedelta(days=7))
 
     def get_monthly_cost(self) -> float:
         """
         Get total cost for the current month.
-        
-        Performance optimization: Uses cached datetime parsing and single comparison.
+
+        Performance optimization: Range lookup on the sorted cost index.
         """
-        today = datetime.now()
-        monthly_cost = sum(
-            entry["cost"]["total"]
-            for entry in self.history
-            if (parsed := self._get_parsed_date(entry["timestamp"])) and
-               parsed.month == today.month and parsed.year == today.year
-        )
-        return monthly_cost
+        start = datetime.combine(datetime.now().date().replace(day=1), time.min)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return self._cost_between(start, end)
 
     def get_cost_by_model(self) -> Dict[str, float]:
         """Get cost breakdown by model."""
@@ -330,14 +520,22 @@ class GPT5CostTracker:
         """Calculate savings from cached tokens."""
         savings = 0.0
         for entry in entries:
-            model_key = entry["model"].lower()
-            if model_key in self.PRICING:
-                pricing = self.PRICING[model_key]
-                cached_tokens = entry["tokens"]["cached_input"]
-                # Savings = (full price - discounted price) * tokens
-                savings += (cached_tokens / 1_000_000) * (pricing["input"] - pricing["cached_input"])
+            input_rate, cached_rate, _ = self._resolve_pricing(entry["model"])
+            cached_tokens = entry["tokens"]["cached_input"]
+            # Savings = (full price - discounted price) * tokens
+            savings += (cached_tokens / 1_000_000) * (input_rate - cached_rate)
         return savings
 
+    def _resolve_pricing(self, model: str) -> Tuple[float, float, float]:
+        """
+        Get (input, cached_input, output) rates per 1M tokens from PRICING.
+
+        Unknown models default to gpt-5 pricing, both when charging a request
+        and when estimating cache savings.
+        """
+        pricing = self.PRICING.get(model.lower(), self.PRICING["gpt-5"])
+        return pricing["input"], pricing["cached_input"], pricing["output"]
+
     def _print_recommendations(self, entries: List[Dict]):
         """Print cost optimization recommendations."""
         recommendations = []
@@ -379,17 +577,27 @@ class GPT5CostTracker:
             pass
 
     def export_to_csv(self, output_path: str = "output/reports/gpt5_costs.csv"):
-        """Export cost history to CSV for analysis."""
+        """
+        Export cost history to CSV for analysis.
+
+        Performance optimization: Rows are encoded into an in-memory buffer
+        and written to disk with a single write.
+        """
         import csv
+        import io
+        import operator
 
         output_file = Path(output_path)
         ensure_parent_dir(output_file)
 
-        with open(output_file, "w", newline="", encoding="utf-8") as f:
-            if not self.history:
-                print("No data to export.")
-                return
+        if not self.history:
+            output_file.write_bytes(b"")
+            print("No data to export.")
+            return
 
+        buffer = io.BytesIO()
+        f = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+        try:
             fieldnames = [
                 "timestamp",
                 "model",
@@ -403,25 +611,21 @@ class GPT5CostTracker:
                 "output_cost",
                 "total_cost",
             ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for entry in self.history:
-                writer.writerow(
-                    {
-                        "timestamp": entry["timestamp"],
-                        "model": entry["model"],
-                        "request_type": entry["request_type"],
-                        "input_tokens": entry["tokens"]["input"],
-                        "cached_tokens": entry["tokens"]["cached_input"],
-                        "output_tokens": entry["tokens"]["output"],
-                        "total_tokens": entry["tokens"]["total"],
-                        "input_cost": entry["cost"]["input"],
-                        "cached_cost": entry["cost"]["cached_input"],
-                        "output_cost": entry["cost"]["output"],
-                        "total_cost": entry["cost"]["total"],
-                    }
-                )
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+
+            # Rows as tuples in fieldnames order; tokens and cost share the same keys
+            get_header_fields = operator.itemgetter("timestamp", "model", "request_type")
+            get_amounts = operator.itemgetter("input", "cached_input", "output", "total")
+            writer.writerows(
+                (*get_header_fields(entry), *get_amounts(entry["tokens"]), *get_amounts(entry["cost"]))
+                for entry in self.history
+            )
+            f.flush()
+            output_file.write_bytes(buffer.getvalue())
+        finally:
+            # Release the buffer without closing it when the wrapper is collected
+            f.detach()
 
         print(f"✅ Cost data exported to {output_file}")
 
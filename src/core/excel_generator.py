@@ -18,7 +18,8 @@ def create_project_management_workbook(filename=None):
     Create a project management Excel workbook.
 
     Args:
-        filename (str, optional): Output filename for the workbook. Defaults to 'Project_Management.xlsx'.
+        filename (str or file-like, optional): Output filename, or a writable binary buffer such as
+            io.BytesIO, for the workbook. Defaults to 'Project_Management.xlsx'.
     """
     if filename is None:
         filename = "Project_Management.xlsx"
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Any, List
 
 # Standard column ordering for CIS audit data
-CIS_AUDIT_COLUMNS = [
+CIS_AUDIT_COLUMNS = (
     "ControlId",
     "Title",
     "Severity",
@@ -25,7 +25,10 @@ CIS_AUDIT_COLUMNS = [
     "Evidence",
     "Reference",
     "Timestamp",
-]
+)
+
+# Every standard column blank; normalize_audit_data overlays each row on this
+_EMPTY_AUDIT_ROW = dict.fromkeys(CIS_AUDIT_COLUMNS, "")
 
 
 def load_json_with_bom(json_path: Path, exit_on_error: bool = True) -> Any:
@@ -47,15 +50,15 @@ def load_json_with_bom(json_path: Path, exit_on_error: bool = True) -> Any:
     """
     json_path = Path(json_path)
 
-    if not json_path.exists():
+    try:
+        # json.loads detects the encoding of raw bytes, including the UTF-8 BOM
+        # from PowerShell's UTF8 encoding, so no separate decode pass is needed
+        return json.loads(json_path.read_bytes())
+    except FileNotFoundError:
         if exit_on_error:
             print(f"ERROR: Input file not found: {json_path}", file=sys.stderr)
             sys.exit(1)
-        raise FileNotFoundError(f"Input file not found: {json_path}")
-
-    try:
-        # Use utf-8-sig to handle UTF-8 BOM from PowerShell's UTF8 encoding
-        return json.loads(json_path.read_text(encoding="utf-8-sig"))
+        raise FileNotFoundError(f"Input file not found: {json_path}") from None
     except json.JSONDecodeError as e:
         if exit_on_error:
             print(f"ERROR: Invalid JSON in {json_path}: {e}", file=sys.stderr)
@@ -86,13 +89,8 @@ def normalize_audit_data(data: Any) -> List[dict]:
 
     results = [data] if isinstance(data, dict) else data
 
-    normalized_results = []
-    for audit_item in results:
-        normalized_item = {column_name: "" for column_name in CIS_AUDIT_COLUMNS}
-        normalized_item.update(audit_item)
-        normalized_results.append(normalized_item)
-
-    return normalized_results
+    # One C-level merge per row; existing and extra fields win over the blanks
+    return [{**_EMPTY_AUDIT_ROW, **audit_item} for audit_item in results]
 
 
 def ensure_parent_dir(path: Path) -> Path:
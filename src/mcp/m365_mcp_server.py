@@ -24,12 +24,15 @@ Environment Variables:
 """
 
 import asyncio
+import functools
 import importlib
+import inspect
 import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 # MCP imports
 try:
@@ -45,6 +48,23 @@ def create_mcp_error(message: str, code: int = -32603) -> McpError:
     return McpError(ErrorData(code=code, message=message))
 
 
+# Defaults applied to optional plugin.json fields; "name" falls back to the plugin directory name
+MANIFEST_DEFAULTS: Dict[str, str] = {
+    "version": "0.0.0",
+    "description": "No description",
+    "entry_point": "tools:register_tools",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_entry_point(entry_point: str) -> Tuple[str, str]:
+    """Split a "module:function" entry point, raising ValueError if malformed."""
+    entry_parts = entry_point.split(":")
+    if len(entry_parts) != 2:
+        raise ValueError(entry_point)
+    return entry_parts[0], entry_parts[1]
+
+
 class PluginInfo:
     """Information about a discovered plugin."""
 
@@ -80,6 +100,7 @@ class M365MCPServer:
         self.plugins_path = Path(__file__).parent / "plugins"
         self._discovered_plugins: Dict[str, PluginInfo] = {}
         self._loaded_plugins: Set[str] = set()
+        self._load_locks: Dict[str, asyncio.Lock] = {}
         self.setup_logging()
         self._discover_plugins()
         self._setup_management_tools()
@@ -113,41 +134,64 @@ class M365MCPServer:
             self.logger.warning(f"Plugins directory not found: {self.plugins_path}")
             return
 
-        for plugin_dir in self.plugins_path.iterdir():
-            if not plugin_dir.is_dir():
-                continue
+        with os.scandir(self.plugins_path) as entries:
+            plugin_entries = [entry for entry in entries if entry.is_dir()]
 
+        discovered_lines: List[str] = []
+        for entry in plugin_entries:
             # Skip __pycache__ and other internal directories
-            if plugin_dir.name.startswith("__"):
+            if entry.name.startswith("__"):
                 continue
 
-            manifest_file = plugin_dir / "plugin.json"
-            if not manifest_file.exists():
-                self.logger.warning(f"Plugin manifest not found for {plugin_dir.name}")
+            plugin_dir = Path(entry.path)
+
+            try:
+                # Read directly rather than probing with exists() first: one syscall per candidate
+                manifest_bytes = (plugin_dir / "plugin.json").read_bytes()
+            except FileNotFoundError:
+                self.logger.warning(f"Plugin manifest not found for {entry.name}")
+                continue
+            except OSError as e:
+                self.logger.error(f"Cannot read plugin manifest for {entry.name}: {e}")
                 continue
 
             try:
-                manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+                manifest = {**MANIFEST_DEFAULTS, **json.loads(manifest_bytes)}
                 plugin_info = PluginInfo(
-                    name=manifest.get("name", plugin_dir.name),
-                    version=manifest.get("version", "0.0.0"),
-                    description=manifest.get("description", "No description"),
-                    entry_point=manifest.get("entry_point", "tools:register_tools"),
+                    name=manifest.get("name") or entry.name,
+                    version=manifest["version"],
+                    description=manifest["description"],
+                    entry_point=manifest["entry_point"],
                     path=plugin_dir,
                 )
                 self._discovered_plugins[plugin_info.name] = plugin_info
-                self.logger.info(f"Discovered plugin: {plugin_info.name} v{plugin_info.version}")
+                discovered_lines.append(f"{plugin_info.name} v{plugin_info.version}")
             except json.JSONDecodeError as e:
-                self.logger.error(f"Invalid JSON in plugin manifest for {plugin_dir.name}: {e}")
-            except (PermissionError, IOError) as e:
-                self.logger.error(f"Cannot read plugin manifest for {plugin_dir.name}: {e}")
+                self.logger.error(f"Invalid JSON in plugin manifest for {entry.name}: {e}")
 
-        self.logger.info(f"Discovered {len(self._discovered_plugins)} plugins")
+        # One log record for the whole cycle instead of one per plugin
+        self.logger.info(
+            f"Discovered {len(self._discovered_plugins)} plugins" + "".join(f"\n  {line}" for line in discovered_lines)
+        )
+
+        # Refresh import finder caches once per discovery so plugins added at runtime
+        # are importable; _load_plugin deliberately does not repeat this per load.
+        importlib.invalidate_caches()
+
+    def _get_load_lock(self, plugin_name: str) -> asyncio.Lock:
+        """Return the lock that serializes loading of a single plugin."""
+        lock = self._load_locks.get(plugin_name)
+        if lock is None:
+            lock = self._load_locks[plugin_name] = asyncio.Lock()
+        return lock
 
-    def _load_plugin(self, plugin_name: str) -> str:
+    async def _load_plugin(self, plugin_name: str) -> str:
         """
         Dynamically load a plugin by name.
 
+        Concurrent loads of the same plugin are serialized so its register
+        function runs at most once. The register function may be sync or async.
+
         Args:
             plugin_name: The name of the plugin to load
 
@@ -165,46 +209,49 @@ class M365MCPServer:
 
         plugin = self._discovered_plugins[plugin_name]
 
-        # Check if already loaded
-        if plugin_name in self._loaded_plugins:
-            return f"Plugin '{plugin_name}' is already loaded."
-
-        # Parse entry point (format: "module:function")
-        entry_parts = plugin.entry_point.split(":")
-        if len(entry_parts) != 2:
-            raise create_mcp_error(f"Invalid entry_point format for {plugin_name}: {plugin.entry_point}")
-
-        module_name, function_name = entry_parts
-
-        try:
-            # Build the full module path
-            # Format: src.mcp.plugins.<plugin_name>.<module_name>
-            full_module_path = f"src.mcp.plugins.{plugin_name}.{module_name}"
-
-            # Import the module dynamically
-            module = importlib.import_module(full_module_path)
-
-            # Get the register function
-            register_func = getattr(module, function_name, None)
-            if register_func is None:
-                raise create_mcp_error(f"Function '{function_name}' not found in module '{full_module_path}'")
+        async with self._get_load_lock(plugin_name):
+            # Check if already loaded (inside the lock so racing loads register once)
+            if plugin_name in self._loaded_plugins:
+                return f"Plugin '{plugin_name}' is already loaded."
 
-            # Call the register function with server and toolkit_path
-            register_func(self.server, self.toolkit_path)
-
-            # Mark as loaded
-            self._loaded_plugins.add(plugin_name)
-            plugin.loaded = True
-
-            self.logger.info(f"Loaded plugin: {plugin_name}")
-            return f"Successfully loaded plugin '{plugin_name}' v{plugin.version}"
+            # Parse entry point (format: "module:function")
+            try:
+                module_name, function_name = _parse_entry_point(plugin.entry_point)
+            except ValueError:
+                raise create_mcp_error(f"Invalid entry_point format for {plugin_name}: {plugin.entry_point}")
 
-        except ModuleNotFoundError as e:
-            raise create_mcp_error(f"Module not found for plugin {plugin_name}: {e}")
-        except AttributeError as e:
-            raise create_mcp_error(f"Entry point function not found for {plugin_name}: {e}")
-        except Exception as e:
-            raise create_mcp_error(f"Failed to load plugin {plugin_name}: {e}")
+            try:
+                # Build the full module path
+                # Format: src.mcp.plugins.<plugin_name>.<module_name>
+                full_module_path = f"src.mcp.plugins.{plugin_name}.{module_name}"
+
+                # Import the module dynamically
+                module = importlib.import_module(full_module_path)
+
+                # Get the register function
+                register_func = getattr(module, function_name, None)
+                if register_func is None:
+                    raise create_mcp_error(f"Function '{function_name}' not found in module '{full_module_path}'")
+
+                # Call the register function with server and toolkit_path
+                # (async register functions are awaited while the load lock is held)
+                result = register_func(self.server, self.toolkit_path)
+                if inspect.isawaitable(result):
+                    await result
+
+                # Mark as loaded
+                self._loaded_plugins.add(plugin_name)
+                plugin.loaded = True
+
+                self.logger.info(f"Loaded plugin: {plugin_name}")
+                return f"Successfully loaded plugin '{plugin_name}' v{plugin.version}"
+
+            except ModuleNotFoundError as e:
+                raise create_mcp_error(f"Module not found for plugin {plugin_name}: {e}")
+            except AttributeError as e:
+                raise create_mcp_error(f"Entry point function not found for {plugin_name}: {e}")
+            except Exception as e:
+                raise create_mcp_error(f"Failed to load plugin {plugin_name}: {e}")
 
     def _setup_management_tools(self) -> None:
         """Register the built-in plugin management tools."""
@@ -261,7 +308,7 @@ See documentation for more details."""
                 Success message with plugin details, or error if loading fails.
             """
             try:
-                result = self._load_plugin(plugin_name)
+                result = await self._load_plugin(plugin_name)
                 plugin = self._discovered_plugins[plugin_name]
                 return f"""✅ {result}
 
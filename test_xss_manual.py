@@ -4,9 +4,16 @@ Manual XSS Vulnerability Test
 Test if the current dashboard generator is vulnerable to XSS attacks
 """
 import json
+import re
+import sys
+import traceback
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+# Import the dashboard generator from scripts/
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from generate_security_dashboard import calculate_statistics, generate_html_dashboard, load_audit_results  # noqa: E402
+
 # Create malicious test data
 malicious_results = [
     {
@@ -22,37 +29,47 @@ malicious_results = [
     }
 ]
 
-print("🔍 Testing XSS Vulnerability in Dashboard Generator...\n")
+# Raw payloads that must not survive unescaped, plus the marker escaping should produce.
+# Kept as bytes so the generated HTML is searched without decoding it first.
+XSS_NEEDLES = {
+    "script": b"<script>alert('XSS1')</script>",
+    "img": b"<img src=x onerror=alert('XSS2')>",
+    "svg": b"<svg/onload=alert('XSS5')>",
+    "escaped": b"&lt;script&gt;",
+}
+# Single alternation so the generated HTML is scanned once for every needle
+XSS_NEEDLE_RE = re.compile(b"|".join(map(re.escape, XSS_NEEDLES.values())))
 
-with TemporaryDirectory() as td:
-    td = Path(td)
 
-    # Create test JSON
-    json_file = td / "test_audit.json"
-    json_file.write_text(json.dumps(malicious_results), encoding="utf-8")
+def probe(payload, workdir):
+    """
+    Generate a dashboard for one payload set inside workdir.
 
-    # Generate dashboard
-    output_html = td / "test_dashboard.html"
+    Returns the raw generated HTML bytes and the set of XSS needles found in them.
+    """
+    json_file = workdir / "test_audit.json"
+    json_file.write_text(json.dumps(payload), encoding="utf-8")
+    output_html = workdir / "test_dashboard.html"
 
     print(f"📄 Input JSON: {json_file}")
     print(f"📄 Output HTML: {output_html}\n")
 
-    # Import and run generator
-    import sys
+    # Load and process data, then generate the dashboard
+    results = load_audit_results(json_file)
+    stats = calculate_statistics(results)
+    generate_html_dashboard(results, stats, [], output_html)
 
-    sys.path.insert(0, str(Path(__file__).parent / "scripts"))
-    from generate_security_dashboard import calculate_statistics, generate_html_dashboard, load_audit_results
+    html_bytes = output_html.read_bytes()
+    return html_bytes, set(XSS_NEEDLE_RE.findall(html_bytes))
 
-    try:
-        # Load and process data
-        results = load_audit_results(json_file)
-        stats = calculate_statistics(results)
 
-        # Generate dashboard
-        generate_html_dashboard(results, stats, [], output_html)
+print("🔍 Testing XSS Vulnerability in Dashboard Generator...\n")
 
-        # Read generated HTML
-        html_content = output_html.read_text(encoding="utf-8")
+with TemporaryDirectory() as td:
+    td = Path(td)
+
+    try:
+        html_bytes, found = probe(malicious_results, td)
 
         # Check for vulnerabilities
         print("🔎 Vulnerability Check:")
@@ -60,23 +77,23 @@ with TemporaryDirectory() as td:
 
         vulnerabilities = []
 
-        if "<script>alert('XSS1')</script>" in html_content:
+        if XSS_NEEDLES["script"] in found:
             vulnerabilities.append("❌ VULNERABLE: Script in ControlId not escaped")
         else:
             print("✅ ControlId: Scripts are escaped")
 
-        if "<img src=x onerror=alert('XSS2')>" in html_content:
+        if XSS_NEEDLES["img"] in found:
             vulnerabilities.append("❌ VULNERABLE: Image tag in Title not escaped")
         else:
             print("✅ Title: Image tags are escaped")
 
-        if "<svg/onload=alert('XSS5')>" in html_content:
+        if XSS_NEEDLES["svg"] in found:
             vulnerabilities.append("❌ VULNERABLE: SVG tag in Actual not escaped")
         else:
             print("✅ Actual: SVG tags are escaped")
 
         # Check if escaped versions exist
-        if "&lt;script&gt;" in html_content:
+        if XSS_NEEDLES["escaped"] in found:
             print("✅ HTML entities found - escaping is working")
         else:
             vulnerabilities.append("⚠️  WARNING: No HTML entities found")
@@ -93,15 +110,13 @@ with TemporaryDirectory() as td:
             print("   The code properly escapes user input")
 
         # Show snippet of generated HTML
-        print(f"\n📋 Generated HTML snippet (first 1000 chars):")
+        print(f"\n📋 Generated HTML snippet (first 1000 bytes):")
         print("-" * 60)
-        print(html_content[:1000])
+        print(html_bytes[:1000].decode("utf-8", "replace"))
         print("...")
 
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-
         traceback.print_exc()
 
 print("\n✅ Test complete!")
@@ -39,6 +39,20 @@ class TestFlaskAppConfiguration:
         assert app is not None
         assert app.config['TESTING'] is False
         assert 'SECRET_KEY' in app.config
+        assert app.config['BCRYPT_ROUNDS'] == 12
+
+    def test_production_app_refuses_low_bcrypt_rounds(self):
+        """
+        Test that a non-TESTING app refuses a bcrypt cost factor below 12.
+
+        Reference: #test_production_app_refuses_low_bcrypt_rounds - Bcrypt floor test
+        """
+        with pytest.raises(ValueError, match="BCRYPT_ROUNDS"):
+            create_app({'BCRYPT_ROUNDS': 4, 'DATABASE_URL': 'sqlite://'})
+
+        # TESTING apps may lower it to keep hashing cheap
+        app = create_app({'TESTING': True, 'BCRYPT_ROUNDS': 4, 'DATABASE_URL': 'sqlite://'})
+        assert app.config['BCRYPT_ROUNDS'] == 4
 
     def test_app_creation_with_custom_config(self):
         """
@@ -177,6 +191,34 @@ class TestFlaskAppConfiguration:
 
         assert app.config.get('DATABASE_URL') == custom_db
 
+    def test_database_engine_exposed(self):
+        """
+        Test that the database engine is exposed on app.extensions.
+
+        Reference: #test_database_engine_exposed - Engine handle for disposal
+        """
+        app = create_app({'TESTING': True, 'DATABASE_URL': 'sqlite://'})
+
+        engine = app.extensions['db_engine']
+        assert str(engine.url) == 'sqlite://'
+        engine.dispose()
+
+    def test_testing_sqlite_uses_static_pool(self):
+        """
+        Test that TESTING apps share one SQLite connection via StaticPool.
+
+        Reference: #test_testing_sqlite_uses_static_pool - Test engine pooling
+        """
+        from sqlalchemy.pool import StaticPool
+
+        testing_engine = create_app({'TESTING': True, 'DATABASE_URL': 'sqlite://'}).extensions['db_engine']
+        default_engine = create_app({'DATABASE_URL': 'sqlite://'}).extensions['db_engine']
+
+        assert isinstance(testing_engine.pool, StaticPool)
+        assert not isinstance(default_engine.pool, StaticPool)
+        testing_engine.dispose()
+        default_engine.dispose()
+
     def test_secret_key_required(self):
         """
         Test that SECRET_KEY is set (required for sessions).
@@ -7,108 +7,210 @@ and database operations for the authentication system.
 Reference: test_auth_api.py - Comprehensive test suite for authentication
 """
 
-import json
-import os
-import tempfile
-import unittest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import hashlib
+import hmac
+from unittest.mock import patch
 
-from src.api.app import create_app
-from src.api.models import DatabaseManager, User
+import pytest
 
+from src.api.models import DEFAULT_BCRYPT_ROUNDS, User
 
-class TestAuthenticationAPI(unittest.TestCase):
+# Password shared by the users seeded for login tests
+LOGIN_PASSWORD = "SecurePass123!"
+
+# Canonical valid registration payload; tests derive variants with {**REGISTRATION_PAYLOAD, ...}
+REGISTRATION_PAYLOAD = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": LOGIN_PASSWORD,
+}
+
+# Real bcrypt methods, restored by the tests that exercise hashing itself
+BCRYPT_SET_PASSWORD = User.set_password
+BCRYPT_CHECK_PASSWORD = User.check_password
+
+
+def _fast_hash(password: str) -> str:
     """
-    Test suite for authentication API endpoints.
+    Hash a password with unsalted SHA-256 (test-only stand-in for bcrypt).
 
-    Tests:
-        - User registration with validation
-        - Password hashing and verification
-        - Duplicate user detection
-        - Login functionality
-        - Input validation
-        - Error handling (missing data, server errors)
-        - Account status checks
+    Reference: #_fast_hash - Fake password hasher for endpoint tests
+    """
+    return "sha256$" + hashlib.sha256(password.encode("utf-8")).hexdigest()
 
-    Reference: #TestAuthenticationAPI - Main test class for auth endpoints
+
+def _fast_set_password(self, password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> None:
     """
+    Test replacement for #User.set_password; ``rounds`` is accepted and ignored.
+    """
+    self.password_hash = _fast_hash(password)
 
-    def setUp(self):
-        """
-        Set up test environment before each test.
 
-        Creates temporary database and Flask test client.
+def _fast_check_password(self, password: str) -> bool:
+    """
+    Test replacement for #User.check_password.
+    """
+    return hmac.compare_digest(self.password_hash, _fast_hash(password))
 
-        Reference: #setUp - Test fixture initialization
-        """
-        # Create temporary database file
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
 
-        # Create Flask app with test configuration
-        self.app = create_app(
-            {
-                "TESTING": True,
-                "DATABASE_URL": f"sqlite:///{self.db_path}",
-                "SECRET_KEY": "test-secret-key",
-            }
-        )
+@pytest.fixture(scope="module", autouse=True)
+def fast_hasher():
+    """
+    Swap bcrypt for a fast hasher for the whole module.
 
-        self.client = self.app.test_client()
+    Endpoint tests don't need bcrypt's deliberate slowness;
+    test_register_user_bcrypt_hash restores the real methods.
 
-        # Store database URL for direct database operations
-        self.database_url = f"sqlite:///{self.db_path}"
+    Reference: #fast_hasher - Module-wide password hasher patch
+    """
+    with patch.object(User, "set_password", _fast_set_password), patch.object(
+        User, "check_password", _fast_check_password
+    ):
+        yield
 
-    def tearDown(self):
-        """
-        Clean up test environment after each test.
 
-        Removes temporary database file.
+@pytest.fixture(scope="module")
+def app(fast_hasher):
+    """
+    Build the Flask app once for the module.
 
-        Reference: #tearDown - Test cleanup
-        """
-        # Close database connections first
-        # This is critical on Windows to release file locks
-        if hasattr(self, 'app'):
-            with self.app.app_context():
-                # Force close any database connections
-                from sqlalchemy import create_engine
-                engine = create_engine(self.database_url)
-                engine.dispose()
-        
-        # Close file descriptor
-        try:
-            os.close(self.db_fd)
-        except (OSError, ValueError):
-            pass  # Already closed
-        
-        # Wait a moment for file locks to release (Windows-specific)
-        import time
-        time.sleep(0.1)
-        
-        # Remove database file
+    The app is backed by an in-memory SQLite database that lives as long
+    as the app's engine; #reset_database clears it between tests and the
+    engine is disposed on teardown.
+
+    Reference: #app - Shared Flask app fixture
+    """
+    # Imported here so collecting or filtering this module doesn't load Flask
+    from src.api.app import create_app
+
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE_URL": "sqlite://",
+            "SECRET_KEY": "test-secret-key",
+            # bcrypt minimum cost factor keeps hashing cheap in tests
+            "BCRYPT_ROUNDS": 4,
+        }
+    )
+    yield app
+    # Close the engine's pooled connections once the module is done
+    app.extensions["db_engine"].dispose()
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """
+    One test client for the module; the auth routes keep no per-client session state.
+
+    Reference: #client - Shared Flask test client
+    """
+    return app.test_client()
+
+
+@pytest.fixture(scope="module")
+def db_manager(app):
+    """
+    The app's database manager.
+
+    The in-memory database only exists on this app's engine, so direct
+    database operations must go through it.
+
+    Reference: #db_manager - Direct database access for assertions and seeding
+    """
+    from src.api import auth_routes
+
+    return auth_routes.db_manager
+
+
+@pytest.fixture(autouse=True)
+def reset_database(db_manager):
+    """
+    Reset the shared in-memory database after each test.
+
+    Reference: #reset_database - Test cleanup
+    """
+    yield
+    db_manager.drop_tables()
+    db_manager.create_tables()
+
+
+@pytest.fixture(scope="module")
+def login_password_hash(fast_hasher):
+    """
+    Hash the password shared by login tests once for the module.
+
+    Login tests seed their users directly with this hash instead of going
+    through the register endpoint.
+
+    Reference: #login_password_hash - Pre-computed login fixture hash
+    """
+    hasher = User()
+    hasher.set_password(LOGIN_PASSWORD)
+    return hasher.password_hash
+
+
+@pytest.fixture
+def create_login_user(db_manager, login_password_hash):
+    """
+    Return a helper that inserts a user with the shared pre-computed password hash.
+
+    Reference: #create_login_user - Direct database seeding for login tests
+    """
+
+    def _create(username: str, email: str) -> None:
+        session = db_manager.get_session()
         try:
-            os.unlink(self.db_path)
-        except (OSError, PermissionError) as e:
-            # On Windows, file may still be locked
-            # Schedule for deletion on next run
-            print(f"Warning: Could not delete temp file {self.db_path}: {e}")
-            pass
+            session.add(User(username=username, email=email, password_hash=login_password_hash))
+            session.commit()
+        finally:
+            session.close()
+
+    return _create
+
 
-    def test_health_check(self):
+@pytest.fixture
+def existing_user(client):
+    """
+    Register a baseline user and return its registration payload.
+
+    Reference: #existing_user - Baseline user for duplicate detection tests
+    """
+    user_data = {**REGISTRATION_PAYLOAD, "username": "duplicate_user", "email": "duplicate@example.com"}
+    response = client.post("/api/auth/register", json=user_data)
+    assert response.status_code == 201
+    return user_data
+
+
+class TestAuthenticationAPI:
+    """
+    Test suite for authentication API endpoints.
+
+    Tests:
+        - User registration with validation
+        - Password hashing and verification
+        - Duplicate user detection
+        - Login functionality
+        - Input validation
+        - Error handling (missing data, server errors)
+        - Account status checks
+
+    Reference: #TestAuthenticationAPI - Main test class for auth endpoints
+    """
+
+    def test_health_check(self, client):
         """
         Test health check endpoint.
 
         Reference: #test_health_check - API health monitoring test
         """
-        response = self.client.get("/api/auth/health")
-        data = json.loads(response.data)
+        response = client.get("/api/auth/health")
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(data["status"], "healthy")
-        self.assertEqual(data["service"], "Authentication API")
+        assert response.status_code == 200
+        assert data["status"] == "healthy"
+        assert data["service"] == "Authentication API"
 
-    def test_register_user_success(self):
+    def test_register_user_success(self, client, db_manager):
         """
         Test successful user registration.
 
@@ -126,118 +228,98 @@ class TestAuthenticationAPI(unittest.TestCase):
         Reference: #test_register_user_success - Happy path registration test
         """
         # Registration data
-        user_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "full_name": "Test User",
-        }
+        user_data = {**REGISTRATION_PAYLOAD, "full_name": "Test User"}
 
         # Send registration request
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Validate response
-        self.assertEqual(response.status_code, 201)
-        self.assertTrue(data["success"])
-        self.assertEqual(data["message"], "User registered successfully")
-        self.assertIn("user", data)
+        assert response.status_code == 201
+        assert data["success"] is True
+        assert data["message"] == "User registered successfully"
+        assert "user" in data
 
         # Validate user data
         user = data["user"]
-        self.assertEqual(user["username"], "testuser")
-        self.assertEqual(user["email"], "test@example.com")
-        self.assertEqual(user["full_name"], "Test User")
-        self.assertTrue(user["is_active"])
-        self.assertIsNotNone(user["created_at"])
+        assert user["username"] == "testuser"
+        assert user["email"] == "test@example.com"
+        assert user["full_name"] == "Test User"
+        assert user["is_active"] is True
+        assert user["created_at"] is not None
 
         # Ensure password is NOT in response
-        self.assertNotIn("password", user)
-        self.assertNotIn("password_hash", user)
+        assert "password" not in user
+        assert "password_hash" not in user
 
         # Verify database record exists
-        db_manager = DatabaseManager(self.database_url)
         session = db_manager.get_session()
         db_user = session.query(User).filter_by(username="testuser").first()
 
-        self.assertIsNotNone(db_user)
-        self.assertEqual(db_user.email, "test@example.com")
-        self.assertTrue(db_user.check_password("SecurePass123!"))  # Integration with #check_password
+        assert db_user is not None
+        assert db_user.email == "test@example.com"
+        assert db_user.check_password("SecurePass123!")  # Integration with #check_password
 
         session.close()
 
-    def test_register_user_duplicate_username(self):
+    def test_register_user_bcrypt_hash(self, client, db_manager):
         """
-        Test registration with duplicate username.
+        Test that registration stores a real bcrypt hash.
+
+        The rest of the module runs against a fast fake hasher; this test
+        restores bcrypt to cover the production hashing path end to end.
 
         Validates:
-            - 409 Conflict status code
-            - Appropriate error message
+            - Stored hash is bcrypt with BCRYPT_ROUNDS from app config
+            - Hash verifies the right password and rejects a wrong one
 
-        Reference: #test_register_user_duplicate_username - Duplicate detection test
+        Reference: #test_register_user_bcrypt_hash - Real password hashing test
         """
-        # Register first user
-        user_data = {
-            "username": "duplicate_user",
-            "email": "user1@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Try to register with same username but different email
-        user_data2 = {
-            "username": "duplicate_user",
-            "email": "user2@example.com",
-            "password": "SecurePass123!",
-        }
-
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data2), content_type="application/json"
-        )
+        user_data = {**REGISTRATION_PAYLOAD, "username": "bcryptuser", "email": "bcrypt@example.com"}
 
-        data = json.loads(response.data)
+        with patch.object(User, "set_password", BCRYPT_SET_PASSWORD), patch.object(
+            User, "check_password", BCRYPT_CHECK_PASSWORD
+        ):
+            response = client.post("/api/auth/register", json=user_data)
+            assert response.status_code == 201
 
-        self.assertEqual(response.status_code, 409)
-        self.assertFalse(data["success"])
-        self.assertIn("Username already exists", data["message"])
+            session = db_manager.get_session()
+            try:
+                db_user = session.query(User).filter_by(username="bcryptuser").first()
+                assert db_user.password_hash.startswith("$2b$04$")  # BCRYPT_ROUNDS from app config
+                assert db_user.check_password("SecurePass123!")
+                assert not db_user.check_password("WrongPass123!")
+            finally:
+                session.close()
 
-    def test_register_user_duplicate_email(self):
+    @pytest.mark.parametrize(
+        "conflict_field, expected_message",
+        [("username", "Username already exists"), ("email", "Email already exists")],
+    )
+    def test_register_user_duplicate(self, client, existing_user, conflict_field, expected_message):
         """
-        Test registration with duplicate email.
+        Test registration that reuses an existing username or email.
 
-        Reference: #test_register_user_duplicate_email - Email uniqueness test
-        """
-        # Register first user
-        user_data = {
-            "username": "user1",
-            "email": "duplicate@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
+        Validates:
+            - 409 Conflict status code
+            - Appropriate error message for the conflicting field
 
-        # Try to register with same email but different username
-        user_data2 = {
-            "username": "user2",
-            "email": "duplicate@example.com",
-            "password": "SecurePass123!",
-        }
+        Reference: #test_register_user_duplicate - Duplicate detection test
+        """
+        # Reuse only the conflicting field; give the other one a fresh value
+        user_data = {**REGISTRATION_PAYLOAD, "username": "other_user", "email": "other@example.com"}
+        user_data[conflict_field] = existing_user[conflict_field]
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data2), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 409)
-        self.assertFalse(data["success"])
-        self.assertIn("Email already exists", data["message"])
+        assert response.status_code == 409
+        assert data["success"] is False
+        assert expected_message in data["message"]
 
-    def test_register_user_invalid_email(self):
+    def test_register_user_invalid_email(self, client):
         """
         Test registration with invalid email format.
 
@@ -246,24 +328,18 @@ class TestAuthenticationAPI(unittest.TestCase):
 
         Reference: #test_register_user_invalid_email - Email validation test
         """
-        user_data = {
-            "username": "testuser",
-            "email": "invalid-email-format",
-            "password": "SecurePass123!",
-        }
+        user_data = {**REGISTRATION_PAYLOAD, "email": "invalid-email-format"}
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
-        self.assertIn("Invalid email format", data["errors"])
+        assert response.status_code == 400
+        assert data["success"] is False
+        assert "errors" in data
+        assert "Invalid email format" in data["errors"]
 
-    def test_register_user_weak_password(self):
+    def test_register_user_weak_password(self, client):
         """
         Test registration with weak password.
 
@@ -272,21 +348,19 @@ class TestAuthenticationAPI(unittest.TestCase):
 
         Reference: #test_register_user_weak_password - Password strength test
         """
-        user_data = {"username": "testuser", "email": "test@example.com", "password": "weak"}
+        user_data = {**REGISTRATION_PAYLOAD, "password": "weak"}
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert data["success"] is False
+        assert "errors" in data
         # Should have multiple password errors
-        self.assertGreater(len(data["errors"]), 0)
+        assert len(data["errors"]) > 0
 
-    def test_register_user_short_username(self):
+    def test_register_user_short_username(self, client):
         """
         Test registration with username too short.
 
@@ -295,129 +369,67 @@ class TestAuthenticationAPI(unittest.TestCase):
 
         Reference: #test_register_user_short_username - Username length validation
         """
-        user_data = {"username": "ab", "email": "test@example.com", "password": "SecurePass123!"}
+        user_data = {**REGISTRATION_PAYLOAD, "username": "ab"}
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("Username must be at least 3 characters", data["errors"])
+        assert response.status_code == 400
+        assert data["success"] is False
+        assert "Username must be at least 3 characters" in data["errors"]
 
     # 🆕 NEW TESTS - Missing Request Body
 
-    def test_register_missing_request_body(self):
+    def test_register_missing_request_body(self, client):
         """
         Test registration without request body.
 
         Reference: #test_register_missing_request_body - Request validation test
         """
-        response = self.client.post(
-            "/api/auth/register",
-            data=None,
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", data=None, content_type="application/json")
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Flask may return 500 for completely missing body, or 400 for empty body
-        self.assertIn(response.status_code, [400, 500])
-        self.assertFalse(data["success"])
+        assert response.status_code in [400, 500]
+        assert data["success"] is False
 
-    def test_register_empty_json(self):
+    def test_register_empty_json(self, client):
         """
         Test registration with empty JSON object.
 
         Reference: #test_register_empty_json - Empty data validation
         """
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps({}),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json={})
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
+        assert response.status_code == 400
+        assert data["success"] is False
         # Empty object will trigger validation errors for missing required fields
-        self.assertIn("message", data)
+        assert "message" in data
 
-    def test_register_missing_username(self):
+    @pytest.mark.parametrize("missing", ["username", "email", "password"])
+    def test_register_missing_required_field(self, client, missing):
         """
-        Test registration without username field.
+        Test registration without each required field in turn.
 
-        Reference: #test_register_missing_username - Required field validation
+        Reference: #test_register_missing_required_field - Required field validation
         """
-        user_data = {
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-        }
+        user_data = {key: value for key, value in REGISTRATION_PAYLOAD.items() if key != missing}
 
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
-
-    def test_register_missing_email(self):
-        """
-        Test registration without email field.
-
-        Reference: #test_register_missing_email - Required field validation
-        """
-        user_data = {
-            "username": "testuser",
-            "password": "SecurePass123!",
-        }
-
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
-
-    def test_register_missing_password(self):
-        """
-        Test registration without password field.
+        response = client.post("/api/auth/register", json=user_data)
 
-        Reference: #test_register_missing_password - Required field validation
-        """
-        user_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-        }
-
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
+        data = response.get_json()
 
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert data["success"] is False
+        assert "errors" in data
 
     # 🆕 NEW TESTS - Login Tests
 
-    def test_login_success(self):
+    def test_login_success(self, client, create_login_user):
         """
         Test successful user login.
 
@@ -427,80 +439,59 @@ class TestAuthenticationAPI(unittest.TestCase):
 
         Reference: #test_login_success - Login flow test
         """
-        # First register a user
-        user_data = {
-            "username": "logintest",
-            "email": "login@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
+        create_login_user("logintest", "login@example.com")
 
         # Now try to login
-        login_data = {"username": "logintest", "password": "SecurePass123!"}
+        login_data = {"username": "logintest", "password": LOGIN_PASSWORD}
 
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(data["success"])
-        self.assertEqual(data["message"], "Login successful")
-        self.assertIn("user", data)
-        self.assertEqual(data["user"]["username"], "logintest")
+        assert response.status_code == 200
+        assert data["success"] is True
+        assert data["message"] == "Login successful"
+        assert "user" in data
+        assert data["user"]["username"] == "logintest"
 
-    def test_login_with_email(self):
+    def test_login_with_email(self, client, create_login_user):
         """
         Test login using email instead of username.
 
         Reference: #test_login_with_email - Alternative login method
         """
-        # Register user
-        user_data = {
-            "username": "emaillogin",
-            "email": "emaillogin@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
+        create_login_user("emaillogin", "emaillogin@example.com")
 
         # Login with email
-        login_data = {"username": "emaillogin@example.com", "password": "SecurePass123!"}
+        login_data = {"username": "emaillogin@example.com", "password": LOGIN_PASSWORD}
 
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(data["success"])
+        assert response.status_code == 200
+        assert data["success"] is True
 
-    def test_login_invalid_password(self):
+    def test_login_invalid_password(self, client, create_login_user):
         """
         Test login with incorrect password.
 
         Reference: #test_login_invalid_password - Authentication failure test
         """
-        # Register user
-        user_data = {
-            "username": "passtest",
-            "email": "passtest@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
+        create_login_user("passtest", "passtest@example.com")
 
         # Try login with wrong password
         login_data = {"username": "passtest", "password": "WrongPassword123!"}
 
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 401)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Invalid credentials")
+        assert response.status_code == 401
+        assert data["success"] is False
+        assert data["message"] == "Invalid credentials"
 
-    def test_login_nonexistent_user(self):
+    def test_login_nonexistent_user(self, client):
         """
         Test login with non-existent username.
 
@@ -508,75 +499,49 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         login_data = {"username": "nonexistent", "password": "SecurePass123!"}
 
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 401)
-        self.assertFalse(data["success"])
+        assert response.status_code == 401
+        assert data["success"] is False
         # Should return generic error to prevent username enumeration
-        self.assertEqual(data["message"], "Invalid credentials")
+        assert data["message"] == "Invalid credentials"
 
-    def test_login_missing_request_body(self):
+    def test_login_missing_request_body(self, client):
         """
         Test login without request body.
 
         Reference: #test_login_missing_request_body - Request validation test
         """
-        response = self.client.post(
-            "/api/auth/login",
-            data=None,
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/login", data=None, content_type="application/json")
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Flask may return 500 for completely missing body
-        self.assertIn(response.status_code, [400, 500])
-        self.assertFalse(data["success"])
+        assert response.status_code in [400, 500]
+        assert data["success"] is False
         # Message could be "Request body is required" or wrapped in "Server error"
-        self.assertTrue(
-            "Request body is required" in data["message"] or
-            "Server error" in data["message"] or
-            "Bad Request" in data["message"]
+        assert (
+            "Request body is required" in data["message"]
+            or "Server error" in data["message"]
+            or "Bad Request" in data["message"]
         )
 
-    def test_login_missing_username(self):
+    @pytest.mark.parametrize("missing", ["username", "password"])
+    def test_login_missing_required_field(self, client, missing):
         """
-        Test login without username field.
+        Test login without username or password field.
 
-        Reference: #test_login_missing_username - Required field validation
+        Reference: #test_login_missing_required_field - Required field validation
         """
-        login_data = {"password": "SecurePass123!"}
+        login_data = {"username": "testuser", "password": "SecurePass123!"}
+        del login_data[missing]
 
-        response = self.client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json"
-        )
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Username and password are required")
-
-    def test_login_missing_password(self):
-        """
-        Test login without password field.
-
-        Reference: #test_login_missing_password - Required field validation
-        """
-        login_data = {"username": "testuser"}
-
-        response = self.client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Username and password are required")
+        assert response.status_code == 400
+        assert data["success"] is False
+        assert data["message"] == "Username and password are required"
@@ -7,366 +7,369 @@ using pytest and temporary directories for isolation.
 Design:
 - Deterministic: No network calls, no system dependencies
 - Flexible: Assert types and structure, not exact counts
-- Isolated: Each test uses TemporaryDirectory
+- Isolated: Read-only tests share scaffold trees built once per session;
+  tests that mutate the tree get their own tmp_path
 - Comprehensive: Cover success cases, edge cases, and error conditions
 """
 
+import contextlib
 import json
+import os
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
 from scripts.copilot_tools import list_docs, show_agent_prompts, check_workspace
 
+# Read-only repository scaffolds, built once per session by the ``scaffolds`` fixture.
+# Keys are paths relative to the scaffold root; values are file bytes, or None for an empty directory.
+SCAFFOLDS = {
+    'empty': {},
+    'basic_docs': {
+        'docs/README.md': b'# Documentation',
+        'docs/guide.rst': b'Guide content',
+        'CHANGELOG.md': b'# Changelog',
+    },
+    'nested_docs': {
+        'docs/api/reference.md': b'API ref',
+        'docs/guides/tutorial.md': b'Tutorial',
+    },
+    'github_docs': {
+        '.github/CONTRIBUTING.md': b'# Contributing',
+    },
+    'sensitive_docs': {
+        '.env': b'SECRET=value',
+        '.env.local': b'SECRET=value',
+        'README.md': b'# Safe file',
+    },
+    'multi_type_docs': {
+        'docs/doc1.md': b'Markdown',
+        'docs/doc2.rst': b'ReStructuredText',
+        'docs/doc3.txt': b'Plain text',
+        'docs/doc4.adoc': b'AsciiDoc',
+    },
+    'agent_basic': {
+        '.github/copilot-instructions.md': b'# Copilot Instructions\nAgent guidance here',
+    },
+    'agent_patterns': {
+        '.github/copilot-instructions.md': b'Copilot',
+        '.github/ai-instructions.md': b'AI',
+        '.github/agent-config.json': b'{}',
+    },
+    'agent_content': {
+        # File with agent-related content but generic name
+        'docs/DEVELOPMENT.md': b'# Development Guide\n\n## Copilot Setup\n\nInstructions for AI agents...',
+    },
+    'workspace_basic': {
+        '.git': None,
+        'requirements.txt': b'pytest\n',
+        'scripts': None,
+        'tests': None,
+    },
+    'workspace_dirs': {
+        'scripts': None,
+        'tests': None,
+        'docs': None,
+    },
+    'workspace_workflows': {
+        '.github/workflows/ci.yml': b'name: CI\non: push',
+        '.github/workflows/test.yml': b'name: Test\non: pull_request',
+        '.github/workflows/release.yaml': b'name: Release\non: release',
+    },
+    'secrets_only': {
+        '.env': b'SECRET_KEY=sensitive',
+        '.env.local': b'API_KEY=secret',
+    },
+    'git_readme': {
+        '.git': None,
+        'README.md': b'# Project',
+    },
+    'readme_only': {
+        'README.md': b'# Test',
+    },
+}
+
+
+def _mkfiles(root: Path, files: dict) -> None:
+    """Create files (and empty directories, for None values) under root."""
+    for relative, content in files.items():
+        path = root / relative
+        if content is None:
+            path.mkdir(parents=True, exist_ok=True)
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+@pytest.fixture(scope='session')
+def scaffolds(tmp_path_factory):
+    """Build every read-only scaffold once per session; maps scaffold name to its root."""
+    roots = {}
+    for name, tree in SCAFFOLDS.items():
+        root = tmp_path_factory.mktemp(name)
+        _mkfiles(root, tree)
+        roots[name] = root
+    return roots
+
 
 class TestListDocs:
     """Tests for list_docs() function."""
 
-    def test_list_docs_basic(self):
+    def test_list_docs_basic(self, scaffolds):
         """Test basic documentation discovery."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Create test documentation structure
-            (root / 'docs').mkdir()
-            (root / 'docs' / 'README.md').write_text('# Documentation', encoding='utf-8')
-            (root / 'docs' / 'guide.rst').write_text('Guide content', encoding='utf-8')
-            (root / 'CHANGELOG.md').write_text('# Changelog', encoding='utf-8')
-
-            result = list_docs(root)
-
-            # Assert structure
-            assert isinstance(result, dict)
-            assert 'docs' in result
-            assert 'count' in result
-            assert 'directories' in result
-
-            # Assert types
-            assert isinstance(result['docs'], list)
-            assert isinstance(result['count'], int)
-            assert isinstance(result['directories'], list)
-
-            # Assert content
-            assert result['count'] == 3
-            assert any(doc['name'] == 'README.md' for doc in result['docs'])
-            assert any(doc['name'] == 'CHANGELOG.md' for doc in result['docs'])
-
-            # Assert doc structure
-            for doc in result['docs']:
-                assert 'name' in doc
-                assert 'path' in doc
-                assert 'type' in doc
-                assert 'size_bytes' in doc
-                assert isinstance(doc['size_bytes'], int)
-                assert doc['size_bytes'] > 0
-
-    def test_list_docs_empty_repo(self):
+        result = list_docs(scaffolds['basic_docs'])
+
+        # Assert structure
+        assert isinstance(result, dict)
+        assert 'docs' in result
+        assert 'count' in result
+        assert 'directories' in result
+
+        # Assert types
+        assert isinstance(result['docs'], list)
+        assert isinstance(result['count'], int)
+        assert isinstance(result['directories'], list)
+
+        # Assert content
+        assert result['count'] == 3
+        assert any(doc['name'] == 'README.md' for doc in result['docs'])
+        assert any(doc['name'] == 'CHANGELOG.md' for doc in result['docs'])
+
+        # Assert doc structure
+        for doc in result['docs']:
+            assert 'name' in doc
+            assert 'path' in doc
+            assert 'type' in doc
+            assert 'size_bytes' in doc
+            assert isinstance(doc['size_bytes'], int)
+            assert doc['size_bytes'] > 0
+
+    def test_list_docs_empty_repo(self, scaffolds):
         """Test with empty repository (no docs)."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            result = list_docs(root)
+        result = list_docs(scaffolds['empty'])
 
-            assert result['count'] == 0
-            assert result['docs'] == []
-            assert isinstance(result['directories'], list)
+        assert result['count'] == 0
+        assert result['docs'] == []
+        assert isinstance(result['directories'], list)
 
-    def test_list_docs_nested_structure(self):
+    def test_list_docs_nested_structure(self, scaffolds):
         """Test with nested documentation structure."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        result = list_docs(scaffolds['nested_docs'])
 
-            # Create nested structure
-            (root / 'docs' / 'api').mkdir(parents=True)
-            (root / 'docs' / 'api' / 'reference.md').write_text('API ref', encoding='utf-8')
-            (root / 'docs' / 'guides').mkdir(parents=True)
-            (root / 'docs' / 'guides' / 'tutorial.md').write_text('Tutorial', encoding='utf-8')
+        assert result['count'] == 2
+        assert any('api' in doc['path'] for doc in result['docs'])
+        assert any('guides' in doc['path'] for doc in result['docs'])
 
-            result = list_docs(root)
+    def test_list_docs_skips_unreadable_subdirectory(self, tmp_path, monkeypatch):
+        """Test that an unreadable subdirectory is skipped without losing its readable siblings."""
+        import scripts.copilot_tools as copilot_tools
 
-            assert result['count'] == 2
-            assert any('api' in doc['path'] for doc in result['docs'])
-            assert any('guides' in doc['path'] for doc in result['docs'])
-
-    def test_list_docs_github_directory(self):
-        """Test discovery in .github directory."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        _mkfiles(tmp_path, {
+            'docs/readable/guide.md': b'# Guide',
+            'docs/blocked/secret.md': b'# Hidden',
+        })
+        blocked = os.path.join(tmp_path, 'docs', 'blocked')
+        real_scandir = os.scandir
 
-            (root / '.github').mkdir()
-            (root / '.github' / 'CONTRIBUTING.md').write_text('# Contributing', encoding='utf-8')
+        def scandir(path):
+            # Simulate a permission-denied directory (chmod 000 is ignored when running as root)
+            if os.fspath(path) == blocked:
+                raise PermissionError(13, 'Permission denied', blocked)
+            # List in name order so the blocked directory is walked before its readable sibling
+            with real_scandir(path) as entries:
+                return contextlib.nullcontext(sorted(entries, key=lambda entry: entry.name))
 
-            result = list_docs(root)
+        monkeypatch.setattr(copilot_tools.os, 'scandir', scandir)
+        result = list_docs(tmp_path)
 
-            assert result['count'] >= 1
-            assert any(doc['name'] == 'CONTRIBUTING.md' for doc in result['docs'])
+        assert [doc['name'] for doc in result['docs']] == ['guide.md']
 
-    def test_list_docs_skips_sensitive_files(self):
-        """Test that sensitive files are skipped."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+    def test_list_docs_github_directory(self, scaffolds):
+        """Test discovery in .github directory."""
+        result = list_docs(scaffolds['github_docs'])
 
-            # Create sensitive files that should be skipped
-            (root / '.env').write_text('SECRET=value', encoding='utf-8')
-            (root / '.env.local').write_text('SECRET=value', encoding='utf-8')
-            (root / 'README.md').write_text('# Safe file', encoding='utf-8')
+        assert result['count'] >= 1
+        assert any(doc['name'] == 'CONTRIBUTING.md' for doc in result['docs'])
 
-            result = list_docs(root)
+    def test_list_docs_skips_sensitive_files(self, scaffolds):
+        """Test that sensitive files are skipped."""
+        result = list_docs(scaffolds['sensitive_docs'])
 
-            # Should only find README.md
-            assert result['count'] == 1
-            assert result['docs'][0]['name'] == 'README.md'
+        # Should only find README.md
+        assert result['count'] == 1
+        assert result['docs'][0]['name'] == 'README.md'
 
-            # Should not include .env files
-            assert not any('.env' in doc['name'] for doc in result['docs'])
+        # Should not include .env files
+        assert not any('.env' in doc['name'] for doc in result['docs'])
 
-    def test_list_docs_multiple_types(self):
+    def test_list_docs_multiple_types(self, scaffolds):
         """Test discovery of different documentation types."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        result = list_docs(scaffolds['multi_type_docs'])
 
-            (root / 'docs').mkdir()
-            (root / 'docs' / 'doc1.md').write_text('Markdown', encoding='utf-8')
-            (root / 'docs' / 'doc2.rst').write_text('ReStructuredText', encoding='utf-8')
-            (root / 'docs' / 'doc3.txt').write_text('Plain text', encoding='utf-8')
-            (root / 'docs' / 'doc4.adoc').write_text('AsciiDoc', encoding='utf-8')
+        assert result['count'] == 4
 
-            result = list_docs(root)
-
-            assert result['count'] == 4
-
-            # Check types are properly identified
-            types = {doc['type'] for doc in result['docs']}
-            assert 'MD' in types
-            assert 'RST' in types
-            assert 'TXT' in types
-            assert 'ADOC' in types
+        # Check types are properly identified
+        types = {doc['type'] for doc in result['docs']}
+        assert 'MD' in types
+        assert 'RST' in types
+        assert 'TXT' in types
+        assert 'ADOC' in types
 
 
 class TestShowAgentPrompts:
     """Tests for show_agent_prompts() function."""
 
-    def test_show_agent_prompts_basic(self):
+    def test_show_agent_prompts_basic(self, scaffolds):
         """Test basic agent prompt discovery."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Create agent configuration files
-            (root / '.github').mkdir()
-            (root / '.github' / 'copilot-instructions.md').write_text(
-                '# Copilot Instructions\nAgent guidance here',
-                encoding='utf-8'
-            )
-
-            result = show_agent_prompts(root)
-
-            # Assert structure
-            assert isinstance(result, dict)
-            assert 'prompts' in result
-            assert 'count' in result
-            assert 'locations' in result
-
-            # Assert types
-            assert isinstance(result['prompts'], list)
-            assert isinstance(result['count'], int)
-            assert isinstance(result['locations'], list)
-
-            # Assert content
-            assert result['count'] >= 1
-            assert any('copilot-instructions' in p['name'] for p in result['prompts'])
-
-    def test_show_agent_prompts_empty_repo(self):
-        """Test with no agent configuration files."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        result = show_agent_prompts(scaffolds['agent_basic'])
 
-            result = show_agent_prompts(root)
+        # Assert structure
+        assert isinstance(result, dict)
+        assert 'prompts' in result
+        assert 'count' in result
+        assert 'locations' in result
 
-            assert result['count'] == 0
-            assert result['prompts'] == []
-            assert isinstance(result['locations'], list)
+        # Assert types
+        assert isinstance(result['prompts'], list)
+        assert isinstance(result['count'], int)
+        assert isinstance(result['locations'], list)
 
-    def test_show_agent_prompts_multiple_patterns(self):
-        """Test discovery of various agent file patterns."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        # Assert content
+        assert result['count'] >= 1
+        assert any('copilot-instructions' in p['name'] for p in result['prompts'])
 
-            (root / '.github').mkdir()
-            (root / '.github' / 'copilot-instructions.md').write_text('Copilot', encoding='utf-8')
-            (root / '.github' / 'ai-instructions.md').write_text('AI', encoding='utf-8')
-            (root / '.github' / 'agent-config.json').write_text('{}', encoding='utf-8')
-
-            result = show_agent_prompts(root)
+    def test_show_agent_prompts_empty_repo(self, scaffolds):
+        """Test with no agent configuration files."""
+        result = show_agent_prompts(scaffolds['empty'])
 
-            # Should find at least 3 files (may find more due to content detection)
-            assert result['count'] >= 3
-            assert any('copilot' in p['name'].lower() for p in result['prompts'])
-            assert any('ai' in p['name'].lower() for p in result['prompts'])
-            assert any('agent' in p['name'].lower() for p in result['prompts'])
+        assert result['count'] == 0
+        assert result['prompts'] == []
+        assert isinstance(result['locations'], list)
 
-    def test_show_agent_prompts_content_detection(self):
-        """Test content-based detection of agent files."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+    def test_show_agent_prompts_multiple_patterns(self, scaffolds):
+        """Test discovery of various agent file patterns."""
+        result = show_agent_prompts(scaffolds['agent_patterns'])
 
-            (root / 'docs').mkdir()
-            # File with agent-related content but generic name
-            (root / 'docs' / 'DEVELOPMENT.md').write_text(
-                '# Development Guide\n\n## Copilot Setup\n\nInstructions for AI agents...',
-                encoding='utf-8'
-            )
+        # Should find at least 3 files (may find more due to content detection)
+        assert result['count'] >= 3
+        assert any('copilot' in p['name'].lower() for p in result['prompts'])
+        assert any('ai' in p['name'].lower() for p in result['prompts'])
+        assert any('agent' in p['name'].lower() for p in result['prompts'])
 
-            result = show_agent_prompts(root)
+    def test_show_agent_prompts_content_detection(self, scaffolds):
+        """Test content-based detection of agent files."""
+        result = show_agent_prompts(scaffolds['agent_content'])
 
-            # Should detect based on content
-            assert result['count'] >= 1
-            assert any('DEVELOPMENT.md' in p['name'] for p in result['prompts'])
+        # Should detect based on content
+        assert result['count'] >= 1
+        assert any('DEVELOPMENT.md' in p['name'] for p in result['prompts'])
 
-    def test_show_agent_prompts_structure(self):
+    def test_show_agent_prompts_structure(self, scaffolds):
         """Test prompt file structure."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            (root / '.github').mkdir()
-            (root / '.github' / 'copilot-instructions.md').write_text('Instructions', encoding='utf-8')
-
-            result = show_agent_prompts(root)
+        result = show_agent_prompts(scaffolds['agent_basic'])
 
-            for prompt in result['prompts']:
-                assert 'name' in prompt
-                assert 'path' in prompt
-                assert 'type' in prompt
-                assert 'size_bytes' in prompt
-                assert isinstance(prompt['size_bytes'], int)
+        for prompt in result['prompts']:
+            assert 'name' in prompt
+            assert 'path' in prompt
+            assert 'type' in prompt
+            assert 'size_bytes' in prompt
+            assert isinstance(prompt['size_bytes'], int)
 
 
 class TestCheckWorkspace:
     """Tests for check_workspace() function."""
 
-    def test_check_workspace_basic(self):
+    def test_check_workspace_basic(self, scaffolds):
         """Test basic workspace health check."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Create minimal valid workspace
-            (root / '.git').mkdir()
-            (root / 'requirements.txt').write_text('pytest\n', encoding='utf-8')
-            (root / 'scripts').mkdir()
-            (root / 'tests').mkdir()
-
-            result = check_workspace(root)
-
-            # Assert structure
-            assert isinstance(result, dict)
-            assert 'status' in result
-            assert 'summary' in result
-            assert 'checks' in result
-            assert 'recommendations' in result
-
-            # Assert types
-            assert isinstance(result['checks'], list)
-            assert isinstance(result['recommendations'], list)
-            assert result['status'] in ['healthy', 'warning', 'error']
-
-            # Assert checks structure
-            for check in result['checks']:
-                assert 'name' in check
-                assert 'status' in check
-                assert 'message' in check
-                assert check['status'] in ['pass', 'fail', 'warning', 'info']
-
-    def test_check_workspace_empty_directory(self):
+        # Minimal valid workspace
+        result = check_workspace(scaffolds['workspace_basic'])
+
+        # Assert structure
+        assert isinstance(result, dict)
+        assert 'status' in result
+        assert 'summary' in result
+        assert 'checks' in result
+        assert 'recommendations' in result
+
+        # Assert types
+        assert isinstance(result['checks'], list)
+        assert isinstance(result['recommendations'], list)
+        assert result['status'] in ['healthy', 'warning', 'error']
+
+        # Assert checks structure
+        for check in result['checks']:
+            assert 'name' in check
+            assert 'status' in check
+            assert 'message' in check
+            assert check['status'] in ['pass', 'fail', 'warning', 'info']
+
+    def test_check_workspace_empty_directory(self, scaffolds):
         """Test with completely empty directory."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        result = check_workspace(scaffolds['empty'])
 
-            result = check_workspace(root)
+        # Should have status but likely warnings/errors
+        assert 'status' in result
+        assert result['status'] in ['warning', 'error']
+        assert len(result['recommendations']) > 0
 
-            # Should have status but likely warnings/errors
-            assert 'status' in result
-            assert result['status'] in ['warning', 'error']
-            assert len(result['recommendations']) > 0
-
-    def test_check_workspace_git_check(self):
+    def test_check_workspace_git_check(self, tmp_path):
         """Test git repository check."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        root = tmp_path
 
-            # Without .git
-            result1 = check_workspace(root)
-            git_check1 = next(c for c in result1['checks'] if c['name'] == 'Git Repository')
-            assert git_check1['status'] == 'fail'
+        # Without .git
+        result1 = check_workspace(root)
+        git_check1 = next(c for c in result1['checks'] if c['name'] == 'Git Repository')
+        assert git_check1['status'] == 'fail'
 
-            # With .git
-            (root / '.git').mkdir()
-            result2 = check_workspace(root)
-            git_check2 = next(c for c in result2['checks'] if c['name'] == 'Git Repository')
-            assert git_check2['status'] == 'pass'
+        # With .git
+        (root / '.git').mkdir()
+        result2 = check_workspace(root)
+        git_check2 = next(c for c in result2['checks'] if c['name'] == 'Git Repository')
+        assert git_check2['status'] == 'pass'
 
-    def test_check_workspace_python_requirements(self):
+    def test_check_workspace_python_requirements(self, tmp_path):
         """Test Python requirements file check."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Without requirements
-            result1 = check_workspace(root)
-            req_check1 = next(c for c in result1['checks'] if c['name'] == 'Python Requirements')
-            assert req_check1['status'] in ['warning', 'fail']
-
-            # With requirements.txt
-            (root / 'requirements.txt').write_text('pytest', encoding='utf-8')
-            result2 = check_workspace(root)
-            req_check2 = next(c for c in result2['checks'] if c['name'] == 'Python Requirements')
-            assert req_check2['status'] == 'pass'
-            assert 'requirements.txt' in req_check2['details']
-
-    def test_check_workspace_directory_structure(self):
-        """Test repository directory structure check."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        root = tmp_path
 
-            # Create some key directories
-            (root / 'scripts').mkdir()
-            (root / 'tests').mkdir()
-            (root / 'docs').mkdir()
+        # Without requirements
+        result1 = check_workspace(root)
+        req_check1 = next(c for c in result1['checks'] if c['name'] == 'Python Requirements')
+        assert req_check1['status'] in ['warning', 'fail']
 
-            result = check_workspace(root)
+        # With requirements.txt
+        _mkfiles(root, {'requirements.txt': b'pytest'})
+        result2 = check_workspace(root)
+        req_check2 = next(c for c in result2['checks'] if c['name'] == 'Python Requirements')
+        assert req_check2['status'] == 'pass'
+        assert 'requirements.txt' in req_check2['details']
 
-            dir_check = next(c for c in result['checks'] if c['name'] == 'Repository Structure')
-            assert 'details' in dir_check
-            assert 'scripts' in dir_check['details']
-            assert 'tests' in dir_check['details']
-            assert 'docs' in dir_check['details']
+    def test_check_workspace_directory_structure(self, scaffolds):
+        """Test repository directory structure check."""
+        result = check_workspace(scaffolds['workspace_dirs'])
 
-    def test_check_workspace_recommendations(self):
-        """Test that recommendations are provided when needed."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        dir_check = next(c for c in result['checks'] if c['name'] == 'Repository Structure')
+        assert 'details' in dir_check
+        assert 'scripts' in dir_check['details']
+        assert 'tests' in dir_check['details']
+        assert 'docs' in dir_check['details']
 
-            # Empty directory should generate recommendations
-            result = check_workspace(root)
+    def test_check_workspace_recommendations(self, scaffolds):
+        """Test that recommendations are provided when needed."""
+        # Empty directory should generate recommendations
+        result = check_workspace(scaffolds['empty'])
 
-            assert len(result['recommendations']) > 0
-            # Should recommend git init
-            assert any('git' in rec.lower() for rec in result['recommendations'])
+        assert len(result['recommendations']) > 0
+        # Should recommend git init
+        assert any('git' in rec.lower() for rec in result['recommendations'])
 
-    def test_check_workspace_ci_workflows(self):
+    def test_check_workspace_ci_workflows(self, scaffolds):
         """Test CI/CD workflow detection."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Create workflow files
-            workflows_dir = root / '.github' / 'workflows'
-            workflows_dir.mkdir(parents=True)
-            (workflows_dir / 'ci.yml').write_text('name: CI\non: push', encoding='utf-8')
-            (workflows_dir / 'test.yml').write_text('name: Test\non: pull_request', encoding='utf-8')
+        result = check_workspace(scaffolds['workspace_workflows'])
 
-            result = check_workspace(root)
-
-            ci_check = next(c for c in result['checks'] if c['name'] == 'CI/CD Workflows')
-            assert ci_check['status'] == 'pass'
-            assert 'ci.yml' in ci_check['details']
+        ci_check = next(c for c in result['checks'] if c['name'] == 'CI/CD Workflows')
+        assert ci_check['status'] == 'pass'
+        assert 'ci.yml' in ci_check['details']
+        assert 'release.yaml' in ci_check['details']
 
 
 class TestCLIIntegration:
@@ -379,101 +382,82 @@ class TestCLIIntegration:
         assert hasattr(cli_module, 'main')
         assert callable(cli_module.main)
 
-    def test_cli_find_repo_root(self):
+    def test_cli_find_repo_root(self, tmp_path, monkeypatch):
         """Test repo root detection function."""
         from scripts.copilot_tools.__main__ import find_repo_root
 
-        with TemporaryDirectory() as td:
-            root = Path(td)
-            (root / '.git').mkdir()
+        root = tmp_path
+        (root / '.git').mkdir()
 
-            # Change to temp directory with proper cleanup
-            import os
-            original_cwd = os.getcwd()
-            detected_root = None
-            try:
-                os.chdir(root)
-                detected_root = find_repo_root()
-            finally:
-                os.chdir(original_cwd)
+        # monkeypatch restores the original working directory after the test
+        monkeypatch.chdir(root)
+        detected_root = find_repo_root()
 
-            # Assert outside the try/finally block
-            assert detected_root is not None
-            assert detected_root == root
+        assert detected_root is not None
+        assert detected_root == root
 
 
 class TestSecurityFeatures:
     """Tests for security features."""
 
-    def test_no_secret_exposure_in_paths(self):
+    def test_no_secret_exposure_in_paths(self, scaffolds):
         """Test that .env files are not exposed."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            # Create sensitive files
-            (root / '.env').write_text('SECRET_KEY=sensitive', encoding='utf-8')
-            (root / '.env.local').write_text('API_KEY=secret', encoding='utf-8')
+        root = scaffolds['secrets_only']
 
-            # Test list_docs
-            docs_result = list_docs(root)
-            assert not any('.env' in doc['path'] for doc in docs_result['docs'])
+        # Test list_docs
+        docs_result = list_docs(root)
+        assert not any('.env' in doc['path'] for doc in docs_result['docs'])
 
-            # Test show_agent_prompts
-            prompts_result = show_agent_prompts(root)
-            assert not any('.env' in prompt['path'] for prompt in prompts_result['prompts'])
+        # Test show_agent_prompts
+        prompts_result = show_agent_prompts(root)
+        assert not any('.env' in prompt['path'] for prompt in prompts_result['prompts'])
 
-    def test_safe_path_checking(self):
+    def test_safe_path_checking(self, scaffolds):
         """Test that paths outside repository are rejected."""
         from scripts.copilot_tools import _is_safe_path
 
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        root = scaffolds['empty']
 
-            # Safe paths
-            assert _is_safe_path(root / 'docs' / 'README.md', root)
-            assert _is_safe_path(root / 'scripts' / 'tool.py', root)
+        # Safe paths
+        assert _is_safe_path(root / 'docs' / 'README.md', root)
+        assert _is_safe_path(root / 'scripts' / 'tool.py', root)
 
-            # Unsafe paths (sensitive directories)
-            assert not _is_safe_path(root / '.env', root)
-            assert not _is_safe_path(root / '.git' / 'config', root)
-            assert not _is_safe_path(root / '__pycache__' / 'module.pyc', root)
-            assert not _is_safe_path(root / '.venv' / 'lib', root)
+        # Unsafe paths (sensitive directories)
+        assert not _is_safe_path(root / '.env', root)
+        assert not _is_safe_path(root / '.git' / 'config', root)
+        assert not _is_safe_path(root / '__pycache__' / 'module.pyc', root)
+        assert not _is_safe_path(root / '.venv' / 'lib', root)
 
 
 class TestOutputFormats:
     """Tests for output format consistency."""
 
-    def test_json_serializable_outputs(self):
+    def test_json_serializable_outputs(self, scaffolds):
         """Test that all outputs are JSON-serializable."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
+        root = scaffolds['git_readme']
 
-            (root / '.git').mkdir()
-            (root / 'README.md').write_text('# Project', encoding='utf-8')
+        # Test each function
+        docs_result = list_docs(root)
+        prompts_result = show_agent_prompts(root)
+        workspace_result = check_workspace(root)
 
-            # Test each function
-            docs_result = list_docs(root)
-            prompts_result = show_agent_prompts(root)
-            workspace_result = check_workspace(root)
+        # All should round-trip through the CLI serializer, compact and pretty
+        from scripts.copilot_tools.__main__ import dumps_output
 
-            # All should be JSON-serializable
-            assert json.dumps(docs_result)
-            assert json.dumps(prompts_result)
-            assert json.dumps(workspace_result)
+        for result in (docs_result, prompts_result, workspace_result):
+            assert json.loads(dumps_output(result)) == result
+            assert json.loads(dumps_output(result, pretty=True)) == result
 
-    def test_consistent_output_structure(self):
+    def test_consistent_output_structure(self, scaffolds):
         """Test that outputs have consistent structure."""
-        with TemporaryDirectory() as td:
-            root = Path(td)
-
-            (root / 'README.md').write_text('# Test', encoding='utf-8')
+        root = scaffolds['readme_only']
 
-            # Test multiple times to ensure consistency
-            result1 = list_docs(root)
-            result2 = list_docs(root)
+        # Test multiple times to ensure consistency
+        result1 = list_docs(root)
+        result2 = list_docs(root)
 
-            assert result1.keys() == result2.keys()
-            assert result1 == result2
+        assert result1.keys() == result2.keys()
+        assert result1 == result2
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 Tests for the GPT-5 Cost Tracker.
 """
 
+import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -23,11 +24,6 @@ def reset_global_tracker():
 class TestGPT5CostTracker:
     """Test suite for the GPT5CostTracker."""
 
-    def setup_method(self):
-        """Reset the global tracker before each test to ensure isolation."""
-        global _global_tracker
-        _global_tracker = None
-
     def test_initialization(self):
         """Test that the cost tracker initializes correctly."""
         with TemporaryDirectory() as td:
@@ -62,6 +58,32 @@ class TestGPT5CostTracker:
         # Should be same as gpt-5: (1000/1M * 4) + (1000/1M * 12) = 0.004 + 0.012 = 0.016
         assert result["request"]["cost"]["total"] == pytest.approx(0.016)
 
+    def test_resolve_pricing(self):
+        """Test that pricing lookup is case-insensitive and falls back to gpt-5."""
+        tracker = GPT5CostTracker()
+        assert tracker._resolve_pricing("GPT-5-Mini") == (1.50, 0.75, 4.50)
+        assert tracker._resolve_pricing("unknown-model") == tracker._resolve_pricing("gpt-5")
+
+    def test_pricing_override_applies_to_costs_and_savings(self, tmp_path):
+        """Test that overriding PRICING changes both request costs and cache savings."""
+
+        class DiscountTracker(GPT5CostTracker):
+            PRICING = {"gpt-5": {"input": 2.00, "cached_input": 0.50, "output": 6.00}}
+
+        tracker = DiscountTracker(log_file=str(tmp_path / "costs.jsonl"))
+        result = tracker.track_request("gpt-5", 1_000_000, 1_000_000, cached_tokens=1_000_000)
+
+        assert result["request"]["cost"]["total"] == pytest.approx(8.50)
+        assert tracker._calculate_cache_savings(tracker.history) == pytest.approx(1.50)
+
+    def test_cache_savings_for_unknown_model_use_gpt5_rates(self, tmp_path):
+        """Test that cache savings for an unknown model are priced at the gpt-5 rates it was charged at."""
+        tracker = GPT5CostTracker(log_file=str(tmp_path / "costs.jsonl"))
+        tracker.track_request("unknown-model", 0, 0, cached_tokens=1_000_000)
+
+        # (4.00 input - 2.00 cached input) per 1M tokens; previously reported as 0
+        assert tracker._calculate_cache_savings(tracker.history) == pytest.approx(2.00)
+
     def test_budget_alert(self, capsys):
         """Test that a budget alert is printed when the daily limit is exceeded."""
         tracker = GPT5CostTracker(budget_limit=0.01)
@@ -72,7 +94,7 @@ class TestGPT5CostTracker:
     def test_history_loading_and_saving(self):
         """Test that usage history is loaded from and saved to a log file."""
         with TemporaryDirectory() as td:
-            log_file = Path(td) / "history.json"
+            log_file = Path(td) / "history.jsonl"
 
             # First session (with auto_save for backward compatibility testing)
             tracker1 = GPT5CostTracker(log_file=str(log_file), auto_save=True)
@@ -86,6 +108,74 @@ class TestGPT5CostTracker:
             tracker2.track_request("gpt-5-nano", 2000, 1000)
             assert len(tracker2.history) == 2
 
+    def test_history_is_appended_as_json_lines(self):
+        """Test that each save appends only the new entries, one JSON object per line."""
+        with TemporaryDirectory() as td:
+            log_file = Path(td) / "history.jsonl"
+
+            tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+            tracker.track_request("gpt-5-mini", 1000, 500)
+            tracker.track_request("gpt-5-nano", 2000, 1000)
+
+            lines = log_file.read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["model"] for line in lines] == ["gpt-5-mini", "gpt-5-nano"]
+
+    def test_legacy_json_array_log_is_migrated(self):
+        """Test that a legacy JSON array log is loaded and rewritten as JSON Lines."""
+        with TemporaryDirectory() as td:
+            log_file = Path(td) / "legacy.json"
+            log_file.write_text(json.dumps([{"model": "gpt-5", "cost": {"total": 1.0}}], indent=2))
+
+            tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+            assert len(tracker.history) == 1
+
+            tracker.track_request("gpt-5-mini", 1000, 500)
+            lines = log_file.read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["model"] for line in lines] == ["gpt-5", "gpt-5-mini"]
+            assert not list(Path(td).glob("*.tmp"))
+
+    def test_default_log_migrates_legacy_default_log(self, tmp_path, monkeypatch):
+        """Test that history in the old default .json log carries over to the new default .jsonl log."""
+        monkeypatch.chdir(tmp_path)
+        legacy_log = tmp_path / cost_tracker.LEGACY_DEFAULT_LOG_FILE
+        legacy_log.parent.mkdir(parents=True)
+        legacy_log.write_text(json.dumps([{"model": "gpt-5", "cost": {"total": 1.0}}], indent=2))
+
+        tracker = GPT5CostTracker(auto_save=True)
+        assert len(tracker.history) == 1
+        tracker.track_request("gpt-5-mini", 1000, 500)
+
+        assert [entry["model"] for entry in GPT5CostTracker().history] == ["gpt-5", "gpt-5-mini"]
+        assert legacy_log.exists()
+
+    def test_truncated_legacy_array_log_is_moved_aside(self, tmp_path, capsys):
+        """Test that an unparseable legacy array log is kept aside instead of appended to."""
+        log_file = tmp_path / "legacy.json"
+        log_file.write_text('[\n  {"model": "gpt-5", "cost": {"total": 1.0}},\n  {"model": "gpt')
+
+        tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+        assert tracker.history == []
+        assert "could not be parsed" in capsys.readouterr().out
+
+        corrupt_files = list(tmp_path.glob("legacy.json.corrupt-*"))
+        assert len(corrupt_files) == 1
+        assert corrupt_files[0].read_text().startswith("[")
+
+        tracker.track_request("gpt-5-mini", 1000, 500)
+        assert len(GPT5CostTracker(log_file=str(log_file)).history) == 1
+
+    def test_append_after_torn_write_starts_new_line(self, tmp_path):
+        """Test that an entry appended after a torn write is not glued onto the partial line."""
+        log_file = tmp_path / "torn.jsonl"
+        log_file.write_text('{"model": "gpt-5", "cost": {"total": 1.0}}\n{"model": "gpt-5-mi')
+
+        tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+        assert len(tracker.history) == 1
+
+        tracker.track_request("gpt-5-nano", 1000, 500)
+        reloaded = GPT5CostTracker(log_file=str(log_file))
+        assert [entry["model"] for entry in reloaded.history] == ["gpt-5", "gpt-5-nano"]
+
     def test_get_periodic_costs(self):
         """Test daily, weekly, and monthly cost calculations."""
         with TemporaryDirectory() as td:
@@ -123,6 +213,40 @@ class TestGPT5CostTracker:
 
             assert tracker.get_monthly_cost() == pytest.approx(monthly_cost)
 
+    def test_periodic_costs_follow_history_changes(self):
+        """Test that period costs stay correct as history is appended to, edited, or replaced."""
+        with TemporaryDirectory() as td:
+            tracker = GPT5CostTracker(log_file=str(Path(td) / "log.jsonl"))
+            now = datetime.now()
+
+            tracker.history.append({"timestamp": now.isoformat(), "cost": {"total": 1.0}})
+            assert tracker.get_weekly_cost() == pytest.approx(1.0)
+
+            # Older entry appended after a newer one
+            tracker.history.append({"timestamp": (now - timedelta(days=3)).isoformat(), "cost": {"total": 2.0}})
+            assert tracker.get_weekly_cost() == pytest.approx(3.0)
+            assert tracker.get_daily_cost() == pytest.approx(1.0)
+
+            # Cleared and refilled in place with the same number of entries
+            tracker.history.clear()
+            tracker.history.extend(
+                [
+                    {"timestamp": now.isoformat(), "cost": {"total": 5.0}},
+                    {"timestamp": now.isoformat(), "cost": {"total": 5.0}},
+                ]
+            )
+            assert tracker.get_daily_cost() == pytest.approx(10.0)
+
+            # Mid-list entry replaced, then one removed (length and last entry unchanged by the first)
+            tracker.history[0] = {"timestamp": now.isoformat(), "cost": {"total": 7.0}}
+            assert tracker.get_daily_cost() == pytest.approx(12.0)
+            del tracker.history[0]
+            assert tracker.get_daily_cost() == pytest.approx(5.0)
+
+            # Replaced outright
+            tracker.history = []
+            assert tracker.get_weekly_cost() == 0.0
+
     def test_get_cost_by_model_and_type(self):
         """Test cost aggregation by model and request type."""
         tracker = GPT5CostTracker()
@@ -201,8 +325,19 @@ class TestGPT5CostTracker:
             tracker = GPT5CostTracker(log_file=str(Path(td) / "nonexistent.json"))
             assert tracker.history == []
 
+            # Test with an empty file
+            empty_path = Path(td) / "empty.jsonl"
+            empty_path.touch()
+            assert GPT5CostTracker(log_file=str(empty_path)).history == []
+
             # Test with invalid JSON file
             invalid_json_path = Path(td) / "invalid.json"
             invalid_json_path.write_text("{invalid json}")
             tracker_invalid = GPT5CostTracker(log_file=str(invalid_json_path))
             assert tracker_invalid.history == []
+
+            # Test with a log whose last write was cut short: good lines are kept
+            truncated_path = Path(td) / "truncated.jsonl"
+            truncated_path.write_text('{"model": "gpt-5"}\n{"model": "gpt-5-mi')
+            tracker_truncated = GPT5CostTracker(log_file=str(truncated_path))
+            assert tracker_truncated.history == [{"model": "gpt-5"}]
@@ -18,10 +18,15 @@ import pytest
 from src.core.cost_tracker import GPT5CostTracker
 
 
+def _read_log(log_file: Path) -> list:
+    """Parse a JSON Lines cost log into its list of entries."""
+    return [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
 def test_auto_save_disabled_performance():
     """Test that auto_save=False improves performance by avoiding disk I/O."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         
         # Test with auto_save=False (optimized)
         tracker_fast = GPT5CostTracker(log_file=str(log_file), auto_save=False)
@@ -38,16 +43,16 @@ def test_auto_save_disabled_performance():
         
         # Verify file doesn't exist yet OR has fewer than 100 entries (only 10 saved at most due to batch save)
         if log_file.exists():
-            saved_count = len(json.loads(log_file.read_text()))
+            saved_count = len(_read_log(log_file))
             assert saved_count <= 100  # At most all entries if batch save triggered
         
         # Manual save
         tracker_fast.save()
         assert log_file.exists()
-        assert len(json.loads(log_file.read_text())) == 100
+        assert len(_read_log(log_file)) == 100
         
         # Test with auto_save=True (slower)
-        log_file2 = Path(tmpdir) / "cost_log2.json"
+        log_file2 = Path(tmpdir) / "cost_log2.jsonl"
         tracker_slow = GPT5CostTracker(log_file=str(log_file2), auto_save=True)
         
         start = time.perf_counter()
@@ -62,7 +67,7 @@ def test_auto_save_disabled_performance():
         
         # Verify auto_save wrote the file
         assert log_file2.exists()
-        assert len(json.loads(log_file2.read_text())) == 100
+        assert len(_read_log(log_file2)) == 100
         
         # auto_save=False should be faster or at least not significantly slower
         # Note: In fast systems, both might be very fast, so we just verify correctness
@@ -73,7 +78,7 @@ def test_auto_save_disabled_performance():
 def test_auto_save_every_10_entries():
     """Test that auto_save=False still saves every 10 entries as safety fallback."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
         
         # Add 9 entries - should not auto-save yet
@@ -96,7 +101,7 @@ def test_auto_save_every_10_entries():
         
         # Now file should exist with all 10 entries (auto-saved on 10th entry)
         assert log_file.exists()
-        saved_data = json.loads(log_file.read_text())
+        saved_data = _read_log(log_file)
         assert len(saved_data) == 10
         
         # Unsaved entries counter should be reset
@@ -106,7 +111,7 @@ def test_auto_save_every_10_entries():
 def test_datetime_caching_performance():
     """Test that datetime caching improves performance of cost queries."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
         
         # Add entries over multiple days
@@ -138,7 +143,7 @@ def test_datetime_caching_performance():
 def test_manual_save_method():
     """Test that manual save() method works correctly."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
         
         # Add some entries
@@ -151,24 +156,24 @@ def test_manual_save_method():
         
         # File shouldn't exist yet (or has fewer entries)
         if log_file.exists():
-            assert len(json.loads(log_file.read_text())) < 5
+            assert len(_read_log(log_file)) < 5
         
         # Manual save
         tracker.save()
         
         # Now file should exist with all entries
         assert log_file.exists()
-        assert len(json.loads(log_file.read_text())) == 5
+        assert len(_read_log(log_file)) == 5
         
         # Calling save() again should be safe (idempotent)
         tracker.save()
-        assert len(json.loads(log_file.read_text())) == 5
+        assert len(_read_log(log_file)) == 5
 
 
 def test_cleanup_saves_history():
     """Test that __del__ method saves unsaved history on cleanup."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         
         # Create tracker in scope that will be destroyed
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
@@ -183,14 +188,14 @@ def test_cleanup_saves_history():
         
         # History should be saved
         assert log_file.exists()
-        data = json.loads(log_file.read_text())
+        data = _read_log(log_file)
         assert len(data) == 1
 
 
 def test_cached_datetime_correctness():
     """Test that datetime caching doesn't affect correctness of results."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
         
         # Add entries for today
@@ -236,7 +241,7 @@ def test_cached_datetime_correctness():
 def test_performance_with_large_history():
     """Test performance with large history (1000+ entries)."""
     with TemporaryDirectory() as tmpdir:
-        log_file = Path(tmpdir) / "cost_log.json"
+        log_file = Path(tmpdir) / "cost_log.jsonl"
         tracker = GPT5CostTracker(log_file=str(log_file), auto_save=False)
         
         # Add 1000 entries
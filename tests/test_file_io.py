@@ -2,125 +2,117 @@
 
 import json
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Any
+from typing import Any, Callable, Type
 
 import pytest
 from pytest import CaptureFixture, MonkeyPatch
 
-from src.core.file_io import CIS_AUDIT_COLUMNS, ensure_parent_dir, load_json_with_bom, normalize_audit_data
+from src.core.file_io import (
+    CIS_AUDIT_COLUMNS,
+    ensure_parent_dir,
+    load_json_with_bom,
+    normalize_audit_data,
+)
 
 
-class TestLoadJsonWithBom:
-    """Tests for load_json_with_bom function."""
-
-    def test_load_regular_json(self):
-        """Test loading regular JSON without BOM."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "test.json"
-            data = [{"key": "value"}]
-            json_path.write_text(json.dumps(data), encoding="utf-8")
-
-            result = load_json_with_bom(json_path, exit_on_error=False)
-            assert result == data
-
-    def test_load_json_with_bom(self):
-        """Test loading JSON with UTF-8 BOM (PowerShell-style)."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "test.json"
-            data = [{"key": "value"}]
-            # Write with BOM (utf-8-sig encoding writes BOM)
-            json_path.write_text(json.dumps(data), encoding="utf-8-sig")
-
-            result = load_json_with_bom(json_path, exit_on_error=False)
-            assert result == data
-
-    def test_load_json_permission_error(self, monkeypatch: MonkeyPatch):
-        """Test that PermissionError is raised for an unreadable file."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "unreadable.json"
-            json_path.write_text("{}", encoding="utf-8")
+def _missing_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    return tmp_path / "nonexistent.json"
 
-            def mock_read_text(*args: Any, **kwargs: Any) -> None:
-                raise PermissionError("Permission denied")
 
-            monkeypatch.setattr(Path, "read_text", mock_read_text)
+def _invalid_json_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    json_path = tmp_path / "invalid.json"
+    json_path.write_text("not valid json {{{", encoding="utf-8")
+    return json_path
 
-            with pytest.raises(PermissionError):
-                load_json_with_bom(json_path, exit_on_error=False)
-
-    def test_load_json_permission_error_exits(self, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]):
-        """Test that sys.exit is called for an unreadable file when exit_on_error=True."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "unreadable.json"
-            json_path.write_text("{}", encoding="utf-8")
-
-            def mock_read_text(*args: Any, **kwargs: Any) -> None:
-                raise PermissionError("Permission denied")
 
-            monkeypatch.setattr(Path, "read_text", mock_read_text)
+def _unreadable_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    json_path = tmp_path / "unreadable.json"
+    json_path.write_text("{}", encoding="utf-8")
 
-            with pytest.raises(SystemExit) as e:
-                load_json_with_bom(json_path, exit_on_error=True)
+    def mock_read_bytes(*args: Any, **kwargs: Any) -> None:
+        raise PermissionError("Permission denied")
 
-            assert e.type == SystemExit
-            assert e.value.code == 1
-            captured = capsys.readouterr()
-            assert "ERROR: Cannot read" in captured.err
+    monkeypatch.setattr(Path, "read_bytes", mock_read_bytes)
+    return json_path
 
-    def test_load_json_file_not_found_exits(self, capsys: CaptureFixture[str]):
-        """Test that sys.exit is called for a missing file when exit_on_error=True."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "nonexistent.json"
 
-            with pytest.raises(SystemExit) as e:
-                load_json_with_bom(json_path, exit_on_error=True)
+# (prepare, exception raised when exit_on_error=False, stderr message when exit_on_error=True)
+LOAD_ERROR_CASES = [
+    (_missing_file, FileNotFoundError, "ERROR: Input file not found"),
+    (_invalid_json_file, json.JSONDecodeError, "ERROR: Invalid JSON"),
+    (_unreadable_file, PermissionError, "ERROR: Cannot read"),
+]
 
-            assert e.type == SystemExit
-            assert e.value.code == 1
-            captured = capsys.readouterr()
-            assert "ERROR: Input file not found" in captured.err
 
-    def test_load_json_invalid_json_exits(self, capsys: CaptureFixture[str]):
-        """Test that sys.exit is called for invalid JSON when exit_on_error=True."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "invalid.json"
-            json_path.write_text("not valid json {{{", encoding="utf-8")
-
-            with pytest.raises(SystemExit) as e:
-                load_json_with_bom(json_path, exit_on_error=True)
+class TestLoadJsonWithBom:
+    """Tests for load_json_with_bom function."""
 
-            assert e.type == SystemExit
-            assert e.value.code == 1
-            captured = capsys.readouterr()
-            assert "ERROR: Invalid JSON" in captured.err
+    def test_load_regular_json(self, tmp_path: Path):
+        """Test loading regular JSON without BOM."""
+        json_path = tmp_path / "test.json"
+        data = [{"key": "value"}]
+        json_path.write_bytes(json.dumps(data).encode("utf-8"))
 
-    def test_load_json_file_not_found(self):
-        """Test that FileNotFoundError is raised for missing file."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "nonexistent.json"
+        result = load_json_with_bom(json_path, exit_on_error=False)
+        assert result == data
 
-            with pytest.raises(FileNotFoundError):
+    def test_load_json_with_bom(self, tmp_path: Path):
+        """Test loading JSON with UTF-8 BOM (PowerShell-style)."""
+        json_path = tmp_path / "test.json"
+        data = [{"key": "value"}]
+        # Write the UTF-8 BOM bytes explicitly, as they appear on disk
+        json_path.write_bytes(b"\xef\xbb\xbf" + json.dumps(data).encode("utf-8"))
+
+        result = load_json_with_bom(json_path, exit_on_error=False)
+        assert result == data
+
+    def test_load_json_utf16_with_bom(self, tmp_path: Path):
+        """Test loading JSON written as UTF-16 with BOM (PowerShell's "Unicode" encoding)."""
+        json_path = tmp_path / "test.json"
+        data = [{"key": "value"}]
+        json_path.write_text(json.dumps(data), encoding="utf-16")
+
+        result = load_json_with_bom(json_path, exit_on_error=False)
+        assert result == data
+
+    @pytest.mark.parametrize("exit_on_error", [False, True])
+    @pytest.mark.parametrize(
+        "prepare,expected_exc,needle",
+        LOAD_ERROR_CASES,
+        ids=["file-not-found", "invalid-json", "permission-error"],
+    )
+    def test_load_json_error(
+        self,
+        tmp_path: Path,
+        monkeypatch: MonkeyPatch,
+        capsys: CaptureFixture[str],
+        prepare: Callable[[Path, MonkeyPatch], Path],
+        expected_exc: Type[BaseException],
+        needle: str,
+        exit_on_error: bool,
+    ):
+        """Test that load errors are raised, or exit with code 1 and a message when exit_on_error=True."""
+        json_path = prepare(tmp_path, monkeypatch)
+
+        if not exit_on_error:
+            with pytest.raises(expected_exc):
                 load_json_with_bom(json_path, exit_on_error=False)
+            return
 
-    def test_load_json_invalid_json(self):
-        """Test that JSONDecodeError is raised for invalid JSON."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "invalid.json"
-            json_path.write_text("not valid json {{{", encoding="utf-8")
+        with pytest.raises(SystemExit) as e:
+            load_json_with_bom(json_path, exit_on_error=True)
 
-            with pytest.raises(json.JSONDecodeError):
-                load_json_with_bom(json_path, exit_on_error=False)
+        assert e.value.code == 1
+        assert needle in capsys.readouterr().err
 
-    def test_load_single_object(self):
+    def test_load_single_object(self, tmp_path: Path):
         """Test loading a single JSON object (not an array)."""
-        with TemporaryDirectory() as td:
-            json_path = Path(td) / "test.json"
-            data = {"ControlId": "CIS-1", "Status": "Pass"}
-            json_path.write_text(json.dumps(data), encoding="utf-8")
+        json_path = tmp_path / "test.json"
+        data = {"ControlId": "CIS-1", "Status": "Pass"}
+        json_path.write_bytes(json.dumps(data).encode("utf-8"))
 
-            result = load_json_with_bom(json_path, exit_on_error=False)
-            assert result == data
+        result = load_json_with_bom(json_path, exit_on_error=False)
+        assert result == data
 
 
 class TestNormalizeAuditData:
@@ -181,68 +173,62 @@ class TestNormalizeAuditData:
 class TestEnsureParentDir:
     """Tests for ensure_parent_dir function."""
 
-    def test_directory_creation(self):
+    def test_directory_creation(self, tmp_path: Path):
         """Test that parent directory is created if it doesn't exist."""
-        with TemporaryDirectory() as td:
-            # Path to a file in a non-existent directory
-            file_path = Path(td) / "new_dir" / "file.txt"
+        # Path to a file in a non-existent directory
+        file_path = tmp_path / "new_dir" / "file.txt"
 
-            # Ensure the directory doesn't exist initially
-            assert not file_path.parent.exists()
+        # Ensure the directory doesn't exist initially
+        assert not file_path.parent.exists()
 
-            # Run the function
-            ensure_parent_dir(file_path)
+        # Run the function
+        ensure_parent_dir(file_path)
 
-            # Check that the directory was created
-            assert file_path.parent.exists()
-            assert file_path.parent.is_dir()
+        # Check that the directory was created
+        assert file_path.parent.exists()
+        assert file_path.parent.is_dir()
 
-    def test_parent_directory_already_exists(self):
+    def test_parent_directory_already_exists(self, tmp_path: Path):
         """Test that the function does nothing if the parent directory already exists."""
-        with TemporaryDirectory() as td:
-            # Path to a file in an existing directory
-            file_path = Path(td) / "file.txt"
+        # Path to a file in an existing directory
+        file_path = tmp_path / "file.txt"
 
-            # Ensure the directory exists
-            assert file_path.parent.exists()
+        # Ensure the directory exists
+        assert file_path.parent.exists()
 
-            # Run the function
-            ensure_parent_dir(file_path)
+        # Run the function
+        ensure_parent_dir(file_path)
 
-            # No error should be raised, and the directory should still exist
-            assert file_path.parent.exists()
+        # No error should be raised, and the directory should still exist
+        assert file_path.parent.exists()
 
-    def test_ensure_parent_dir_creates_directory(self):
+    def test_ensure_parent_dir_creates_directory(self, tmp_path: Path):
         """Test that the parent directory is created if it doesn't exist."""
-        with TemporaryDirectory() as td:
-            base_path = Path(td)
-            new_dir = base_path / "new_parent" / "child.txt"
+        new_dir = tmp_path / "new_parent" / "child.txt"
 
-            # Pre-condition: directory does not exist
-            assert not new_dir.parent.exists()
+        # Pre-condition: directory does not exist
+        assert not new_dir.parent.exists()
 
-            ensure_parent_dir(new_dir)
+        ensure_parent_dir(new_dir)
 
-            # Post-condition: directory exists
-            assert new_dir.parent.exists()
-            assert new_dir.parent.is_dir()
+        # Post-condition: directory exists
+        assert new_dir.parent.exists()
+        assert new_dir.parent.is_dir()
 
-    def test_ensure_parent_dir_does_not_fail_if_exists(self):
+    def test_ensure_parent_dir_does_not_fail_if_exists(self, tmp_path: Path):
         """Test that the function does not fail if the directory already exists."""
-        with TemporaryDirectory() as td:
-            base_path = Path(td)
-            existing_dir = base_path / "existing_parent"
-            existing_dir.mkdir()
-            file_path = existing_dir / "child.txt"
+        existing_dir = tmp_path / "existing_parent"
+        existing_dir.mkdir()
+        file_path = existing_dir / "child.txt"
 
-            # Pre-condition: directory exists
-            assert file_path.parent.exists()
+        # Pre-condition: directory exists
+        assert file_path.parent.exists()
 
-            # Should run without error
-            ensure_parent_dir(file_path)
+        # Should run without error
+        ensure_parent_dir(file_path)
 
-            # Post-condition: directory still exists
-            assert file_path.parent.exists()
+        # Post-condition: directory still exists
+        assert file_path.parent.exists()
 
 
 class TestCisAuditColumns:
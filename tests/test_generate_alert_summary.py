@@ -8,19 +8,159 @@ Reference: test_generate_alert_summary.py - Comprehensive tests for alert summar
 """
 
 import json
+import time
 import pytest
 from datetime import datetime, timedelta
-from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import patch, MagicMock
 
-# Import the module under test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from scripts.generate_alert_summary import AlertSummaryGenerator
 
 
+def _write_json(path, obj):
+    """Write obj to path as UTF-8 JSON."""
+    path.write_bytes(json.dumps(obj).encode("utf-8"))
+
+
+# Shared read-only sample data; tests only read these through the JSON files below
+SAMPLE_ALERTS_DB = {
+    "metadata": {
+        "last_updated": "2025-12-11T10:00:00Z",
+        "version": "1.0"
+    },
+    "alerts": {
+        "ALERT001": {
+            "id": "ALERT001",
+            "source": "Defender",
+            "severity": "CRITICAL",
+            "status": "new",
+            "title": "Malware detected on workstation",
+            "created": "2025-12-10T08:00:00Z",
+            "last_seen": "2025-12-11T09:00:00Z",
+            "is_false_positive": False,
+            "normalized_severity": 100
+        },
+        "ALERT002": {
+            "id": "ALERT002",
+            "source": "Azure Sentinel",
+            "severity": "HIGH",
+            "status": "investigating",
+            "title": "Suspicious login from unknown location",
+            "created": "2025-12-10T10:00:00Z",
+            "last_seen": "2025-12-11T08:00:00Z",
+            "is_false_positive": False,
+            "normalized_severity": 70
+        },
+        "ALERT003": {
+            "id": "ALERT003",
+            "source": "Defender",
+            "severity": "MEDIUM",
+            "status": "remediated",
+            "title": "Outdated software detected",
+            "created": "2025-12-09T14:00:00Z",
+            "last_seen": "2025-12-10T16:00:00Z",
+            "is_false_positive": False,
+            "remediated_at": "2025-12-10T17:00:00Z",
+            "normalized_severity": 40
+        },
+        "ALERT004": {
+            "id": "ALERT004",
+            "source": "M365 Defender",
+            "severity": "LOW",
+            "status": "closed",
+            "title": "Password policy violation",
+            "created": "2025-12-08T09:00:00Z",
+            "last_seen": "2025-12-09T10:00:00Z",
+            "is_false_positive": True,
+            "normalized_severity": 10
+        },
+        "ALERT005": {
+            "id": "ALERT005",
+            "source": "Azure Sentinel",
+            "severity": "HIGH",
+            "status": "escalated",
+            "title": "Brute force attack detected",
+            "created": "2025-12-10T12:00:00Z",
+            "last_seen": "2025-12-11T07:00:00Z",
+            "is_false_positive": False,
+            "escalated_at": "2025-12-11T06:00:00Z",
+            "escalation_reason": "Requires SOC investigation",
+            "normalized_severity": 70
+        }
+    }
+}
+
+SAMPLE_REMEDIATION_LOG = [
+    {
+        "alert_id": "ALERT003",
+        "action": "update_software",
+        "result": "success",
+        "timestamp": "2025-12-10T17:00:00Z"
+    },
+    {
+        "alert_id": "ALERT006",
+        "action": "block_ip",
+        "result": "success",
+        "timestamp": "2025-12-09T15:00:00Z"
+    },
+    {
+        "alert_id": "ALERT007",
+        "action": "disable_user",
+        "result": "failed",
+        "timestamp": "2025-12-08T11:00:00Z"
+    }
+]
+
+# The samples never change, so they are serialized once at import time
+SAMPLE_ALERTS_DB_BYTES = json.dumps(SAMPLE_ALERTS_DB).encode("utf-8")
+SAMPLE_REMEDIATION_LOG_BYTES = json.dumps(SAMPLE_REMEDIATION_LOG).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def alert_input_files(tmp_path_factory):
+    """
+    Write the sample alert and remediation files once per session.
+
+    Reference: #alert_input_files - Shared read-only input files
+    """
+    td = tmp_path_factory.mktemp("alerts")
+
+    # Create alerts database
+    alerts_db_path = td / "alerts.json"
+    alerts_db_path.write_bytes(SAMPLE_ALERTS_DB_BYTES)
+
+    # Create remediation log
+    remediation_log_path = td / "remediation_log.json"
+    remediation_log_path.write_bytes(SAMPLE_REMEDIATION_LOG_BYTES)
+
+    return {
+        "alerts_db": alerts_db_path,
+        "remediation_log": remediation_log_path
+    }
+
+
+@pytest.fixture(scope="module")
+def generator(alert_input_files):
+    """
+    Provide one generator over the shared sample files for read-only tests.
+
+    Reference: #generator - Shared AlertSummaryGenerator fixture
+    """
+    return AlertSummaryGenerator(
+        alerts_db_path=alert_input_files["alerts_db"],
+        remediation_log_path=alert_input_files["remediation_log"]
+    )
+
+
+@pytest.fixture(scope="module")
+def stats(generator):
+    """
+    Provide statistics computed once from the shared generator.
+
+    Reference: #stats - Shared statistics fixture
+    """
+    return generator.calculate_statistics()
+
+
 class TestAlertSummaryGenerator:
     """
     Test suite for AlertSummaryGenerator class.
@@ -36,180 +176,50 @@ class TestAlertSummaryGenerator:
     """
 
     @pytest.fixture
-    def sample_alerts_db(self):
+    def temp_alert_files(self, alert_input_files, tmp_path):
         """
-        Provide sample alerts database for testing.
+        Provide the shared input files plus a fresh per-test output directory.
 
-        Reference: #sample_alerts_db - Test fixture for alerts data
+        Reference: #temp_alert_files - File setup fixture
         """
         return {
-            "metadata": {
-                "last_updated": "2025-12-11T10:00:00Z",
-                "version": "1.0"
-            },
-            "alerts": {
-                "ALERT001": {
-                    "id": "ALERT001",
-                    "source": "Defender",
-                    "severity": "CRITICAL",
-                    "status": "new",
-                    "title": "Malware detected on workstation",
-                    "created": "2025-12-10T08:00:00Z",
-                    "last_seen": "2025-12-11T09:00:00Z",
-                    "is_false_positive": False,
-                    "normalized_severity": 100
-                },
-                "ALERT002": {
-                    "id": "ALERT002",
-                    "source": "Azure Sentinel",
-                    "severity": "HIGH",
-                    "status": "investigating",
-                    "title": "Suspicious login from unknown location",
-                    "created": "2025-12-10T10:00:00Z",
-                    "last_seen": "2025-12-11T08:00:00Z",
-                    "is_false_positive": False,
-                    "normalized_severity": 70
-                },
-                "ALERT003": {
-                    "id": "ALERT003",
-                    "source": "Defender",
-                    "severity": "MEDIUM",
-                    "status": "remediated",
-                    "title": "Outdated software detected",
-                    "created": "2025-12-09T14:00:00Z",
-                    "last_seen": "2025-12-10T16:00:00Z",
-                    "is_false_positive": False,
-                    "remediated_at": "2025-12-10T17:00:00Z",
-                    "normalized_severity": 40
-                },
-                "ALERT004": {
-                    "id": "ALERT004",
-                    "source": "M365 Defender",
-                    "severity": "LOW",
-                    "status": "closed",
-                    "title": "Password policy violation",
-                    "created": "2025-12-08T09:00:00Z",
-                    "last_seen": "2025-12-09T10:00:00Z",
-                    "is_false_positive": True,
-                    "normalized_severity": 10
-                },
-                "ALERT005": {
-                    "id": "ALERT005",
-                    "source": "Azure Sentinel",
-                    "severity": "HIGH",
-                    "status": "escalated",
-                    "title": "Brute force attack detected",
-                    "created": "2025-12-10T12:00:00Z",
-                    "last_seen": "2025-12-11T07:00:00Z",
-                    "is_false_positive": False,
-                    "escalated_at": "2025-12-11T06:00:00Z",
-                    "escalation_reason": "Requires SOC investigation",
-                    "normalized_severity": 70
-                }
-            }
+            "alerts_db": alert_input_files["alerts_db"],
+            "remediation_log": alert_input_files["remediation_log"],
+            "output_dir": tmp_path / "output"
         }
 
-    @pytest.fixture
-    def sample_remediation_log(self):
-        """
-        Provide sample remediation log for testing.
-
-        Reference: #sample_remediation_log - Test fixture for remediation data
-        """
-        return [
-            {
-                "alert_id": "ALERT003",
-                "action": "update_software",
-                "result": "success",
-                "timestamp": "2025-12-10T17:00:00Z"
-            },
-            {
-                "alert_id": "ALERT006",
-                "action": "block_ip",
-                "result": "success",
-                "timestamp": "2025-12-09T15:00:00Z"
-            },
-            {
-                "alert_id": "ALERT007",
-                "action": "disable_user",
-                "result": "failed",
-                "timestamp": "2025-12-08T11:00:00Z"
-            }
-        ]
-
-    @pytest.fixture
-    def temp_alert_files(self, sample_alerts_db, sample_remediation_log):
-        """
-        Create temporary alert and remediation files for testing.
-
-        Reference: #temp_alert_files - File setup fixture
-        """
-        with TemporaryDirectory() as td:
-            td = Path(td)
-            
-            # Create alerts database
-            alerts_db_path = td / "alerts.json"
-            with open(alerts_db_path, "w") as f:
-                json.dump(sample_alerts_db, f)
-            
-            # Create remediation log
-            remediation_log_path = td / "remediation_log.json"
-            with open(remediation_log_path, "w") as f:
-                json.dump(sample_remediation_log, f)
-            
-            yield {
-                "alerts_db": alerts_db_path,
-                "remediation_log": remediation_log_path,
-                "output_dir": td / "output"
-            }
-
-    def test_initialization_with_valid_files(self, temp_alert_files):
+    def test_initialization_with_valid_files(self, generator):
         """
         Test AlertSummaryGenerator initialization with valid files.
 
         Reference: #test_initialization_with_valid_files - Constructor test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
         assert generator.alerts_db is not None
         assert "alerts" in generator.alerts_db
         assert len(generator.alerts_db["alerts"]) == 5
         assert len(generator.remediation_log) == 3
 
-    def test_initialization_with_missing_files(self):
+    def test_initialization_with_missing_files(self, tmp_path):
         """
         Test AlertSummaryGenerator initialization with missing files.
 
         Reference: #test_initialization_with_missing_files - Error handling test
         """
-        with TemporaryDirectory() as td:
-            td = Path(td)
-            
-            generator = AlertSummaryGenerator(
-                alerts_db_path=td / "nonexistent_alerts.json",
-                remediation_log_path=td / "nonexistent_log.json"
-            )
+        generator = AlertSummaryGenerator(
+            alerts_db_path=tmp_path / "nonexistent_alerts.json",
+            remediation_log_path=tmp_path / "nonexistent_log.json"
+        )
 
-            # Should initialize with empty data structures
-            assert generator.alerts_db == {"alerts": {}, "metadata": {}}
-            assert generator.remediation_log == []
+        # Should initialize with empty data structures
+        assert generator.alerts_db == {"alerts": {}, "metadata": {}}
+        assert generator.remediation_log == []
 
-    def test_calculate_statistics_basic(self, temp_alert_files):
+    def test_calculate_statistics_basic(self, stats):
         """
         Test basic statistics calculation.
 
         Reference: #test_calculate_statistics_basic - Statistics test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-
         # Total counts
         assert stats["total_alerts"] == 5
         assert stats["remediated_count"] == 1
@@ -218,19 +228,12 @@ class TestAlertSummaryGenerator:
         assert stats["pending_count"] == 2  # new + investigating
         assert stats["false_positives"] == 1
 
-    def test_calculate_statistics_by_severity(self, temp_alert_files):
+    def test_calculate_statistics_by_severity(self, stats):
         """
         Test statistics calculation by severity.
 
         Reference: #test_calculate_statistics_by_severity - Severity grouping test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-
         # Check severity counts
         assert stats["by_severity"]["CRITICAL"] == 1
         assert stats["by_severity"]["HIGH"] == 2
@@ -241,102 +244,70 @@ class TestAlertSummaryGenerator:
         assert stats["critical_severity_open"] == 1  # ALERT001 is new
         assert stats["high_severity_open"] == 2  # ALERT002 investigating, ALERT005 escalated
 
-    def test_calculate_statistics_by_source(self, temp_alert_files):
+    def test_calculate_statistics_by_source(self, stats):
         """
         Test statistics calculation by source.
 
         Reference: #test_calculate_statistics_by_source - Source grouping test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-
         # Check source counts
         assert stats["by_source"]["Defender"] == 2
         assert stats["by_source"]["Azure Sentinel"] == 2
         assert stats["by_source"]["M365 Defender"] == 1
 
-    def test_calculate_statistics_rates(self, temp_alert_files):
+    def test_calculate_statistics_rates(self, stats):
         """
         Test calculation of remediation and closure rates.
 
         Reference: #test_calculate_statistics_rates - Rate calculation test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-
         # Rates (1 remediated + 1 closed out of 5 total)
         assert stats["remediation_rate"] == 20.0  # 1/5 = 20%
         assert stats["closure_rate"] == 40.0  # (1+1)/5 = 40%
         assert stats["escalation_rate"] == 20.0  # 1/5 = 20%
 
-    def test_calculate_statistics_remediation_log(self, temp_alert_files):
+    def test_calculate_statistics_remediation_log(self, stats):
         """
         Test statistics from remediation log.
 
         Reference: #test_calculate_statistics_remediation_log - Remediation stats test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-
         assert stats["total_remediation_actions"] == 3
         assert stats["successful_remediations"] == 2
         assert stats["failed_remediations"] == 1
 
-    def test_calculate_statistics_empty_data(self):
+    def test_calculate_statistics_empty_data(self, tmp_path):
         """
         Test statistics calculation with no alerts.
 
         Reference: #test_calculate_statistics_empty_data - Edge case test
         """
-        with TemporaryDirectory() as td:
-            td = Path(td)
-            
-            # Create empty files
-            empty_alerts = td / "empty_alerts.json"
-            empty_log = td / "empty_log.json"
-            
-            with open(empty_alerts, "w") as f:
-                json.dump({"alerts": {}, "metadata": {}}, f)
-            
-            with open(empty_log, "w") as f:
-                json.dump([], f)
-            
-            generator = AlertSummaryGenerator(
-                alerts_db_path=empty_alerts,
-                remediation_log_path=empty_log
-            )
+        # Create empty files
+        empty_alerts = tmp_path / "empty_alerts.json"
+        empty_log = tmp_path / "empty_log.json"
 
-            stats = generator.calculate_statistics()
+        _write_json(empty_alerts, {"alerts": {}, "metadata": {}})
 
-            assert stats["total_alerts"] == 0
-            assert stats["remediation_rate"] == 0
-            assert stats["closure_rate"] == 0
-            assert stats["escalation_rate"] == 0
+        _write_json(empty_log, [])
+
+        generator = AlertSummaryGenerator(
+            alerts_db_path=empty_alerts,
+            remediation_log_path=empty_log
+        )
+
+        stats = generator.calculate_statistics()
 
-    def test_generate_executive_summary(self, temp_alert_files):
+        assert stats["total_alerts"] == 0
+        assert stats["remediation_rate"] == 0
+        assert stats["closure_rate"] == 0
+        assert stats["escalation_rate"] == 0
+
+    def test_generate_executive_summary(self, generator, stats):
         """
         Test executive summary generation.
 
         Reference: #test_generate_executive_summary - Summary format test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
         summary = generator.generate_executive_summary(stats)
 
         # Check key content is present
@@ -346,35 +317,23 @@ class TestAlertSummaryGenerator:
         assert "Critical Severity (Open): 1" in summary
         assert "RECOMMENDATIONS:" in summary
 
-    def test_generate_executive_summary_with_warnings(self, temp_alert_files):
+    def test_generate_executive_summary_with_warnings(self, generator, stats):
         """
         Test executive summary includes appropriate warnings.
 
         Reference: #test_generate_executive_summary_with_warnings - Warning generation test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
         summary = generator.generate_executive_summary(stats)
 
         # Should warn about critical alerts
         assert "⚠️  URGENT: 1 critical alerts require immediate attention" in summary
 
-    def test_generate_detailed_breakdown(self, temp_alert_files):
+    def test_generate_detailed_breakdown(self, generator, stats):
         """
         Test detailed breakdown generation.
 
         Reference: #test_generate_detailed_breakdown - Breakdown format test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
         breakdown = generator.generate_detailed_breakdown(stats)
 
         # Check sections are present
@@ -401,8 +360,7 @@ class TestAlertSummaryGenerator:
         assert output_path.exists()
 
         # Verify content
-        with open(output_path, "r") as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         assert "metadata" in data
         assert "statistics" in data
@@ -434,21 +392,14 @@ class TestAlertSummaryGenerator:
         assert "Total Alerts" in html_content
         assert "Critical Open" in html_content
 
-    @pytest.mark.skipif(
-        not hasattr(pytest, "importorskip"),
-        reason="pandas not available"
-    )
     def test_export_excel_with_pandas(self, temp_alert_files):
         """
         Test Excel export functionality when pandas is available.
 
         Reference: #test_export_excel_with_pandas - Excel export test
         """
-        try:
-            import pandas as pd
-            import openpyxl
-        except ImportError:
-            pytest.skip("pandas or openpyxl not available")
+        pytest.importorskip("pandas")
+        openpyxl = pytest.importorskip("openpyxl")
 
         generator = AlertSummaryGenerator(
             alerts_db_path=temp_alert_files["alerts_db"],
@@ -495,17 +446,12 @@ class TestAlertSummaryGenerator:
         finally:
             module.PANDAS_AVAILABLE = original_pandas_available
 
-    def test_generate_alert_details(self, temp_alert_files):
+    def test_generate_alert_details(self, generator):
         """
         Test alert details generation.
 
         Reference: #test_generate_alert_details - Details format test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
         details = generator.generate_alert_details()
 
         # Check content
@@ -516,82 +462,67 @@ class TestAlertSummaryGenerator:
         assert "ALERT001" in details
         assert "Potential False Positive" in details  # ALERT004
 
-    @pytest.mark.parametrize("status,count", [
-        ("new", 1),
-        ("investigating", 1),
-        ("remediated", 1),
-        ("escalated", 1),
-        ("closed", 1),
-    ])
-    def test_statistics_by_status(self, temp_alert_files, status, count):
+    def test_statistics_by_status(self, stats):
         """
         Test statistics calculation for each status type.
 
-        Parameterized test to verify status counting logic.
+        Checks every status count against one statistics run.
 
-        Reference: #test_statistics_by_status - Parameterized status test
+        Reference: #test_statistics_by_status - Status counting test
         """
-        generator = AlertSummaryGenerator(
-            alerts_db_path=temp_alert_files["alerts_db"],
-            remediation_log_path=temp_alert_files["remediation_log"]
-        )
-
-        stats = generator.calculate_statistics()
-        assert stats["by_status"].get(status, 0) == count
+        expected = {"new": 1, "investigating": 1, "remediated": 1, "escalated": 1, "closed": 1}
+        assert {status: stats["by_status"].get(status, 0) for status in expected} == expected
 
-    def test_large_dataset_performance(self):
+    def test_large_dataset_performance(self, tmp_path):
         """
         Test generator performance with large dataset.
 
         Reference: #test_large_dataset_performance - Performance test
         """
-        with TemporaryDirectory() as td:
-            td = Path(td)
-            
-            # Create large dataset (1000 alerts)
-            large_alerts = {
-                "metadata": {},
-                "alerts": {}
-            }
-            
-            for i in range(1000):
-                large_alerts["alerts"][f"ALERT{i:04d}"] = {
+        # Create large dataset (1000 alerts)
+        severities = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+        statuses = ("new", "investigating", "remediated", "closed")
+        large_alerts = {
+            "metadata": {},
+            "alerts": {
+                f"ALERT{i:04d}": {
                     "id": f"ALERT{i:04d}",
                     "source": "Defender",
-                    "severity": ["CRITICAL", "HIGH", "MEDIUM", "LOW"][i % 4],
-                    "status": ["new", "investigating", "remediated", "closed"][i % 4],
+                    "severity": severities[i % 4],
+                    "status": statuses[i % 4],
                     "title": f"Test alert {i}",
                     "created": "2025-12-10T08:00:00Z",
                     "last_seen": "2025-12-11T09:00:00Z",
                     "is_false_positive": False,
                     "normalized_severity": 50
                 }
-            
-            alerts_path = td / "large_alerts.json"
-            log_path = td / "empty_log.json"
-            
-            with open(alerts_path, "w") as f:
-                json.dump(large_alerts, f)
-            
-            with open(log_path, "w") as f:
-                json.dump([], f)
-            
-            # Test performance (should complete quickly)
-            import time
-            start = time.time()
-            
-            generator = AlertSummaryGenerator(
-                alerts_db_path=alerts_path,
-                remediation_log_path=log_path
-            )
-            
-            stats = generator.calculate_statistics()
-            
-            elapsed = time.time() - start
-            
-            # Should process 1000 alerts in <1 second
-            assert elapsed < 1.0
-            assert stats["total_alerts"] == 1000
+                for i in range(1000)
+            }
+        }
+
+        alerts_path = tmp_path / "large_alerts.json"
+        log_path = tmp_path / "empty_log.json"
+
+        _write_json(alerts_path, large_alerts)
+
+        _write_json(log_path, [])
+
+        # Test performance (should complete quickly); perf_counter is monotonic
+        # and high-resolution, unlike time.time which can jump with clock changes
+        start = time.perf_counter()
+
+        generator = AlertSummaryGenerator(
+            alerts_db_path=alerts_path,
+            remediation_log_path=log_path
+        )
+
+        stats = generator.calculate_statistics()
+
+        elapsed = time.perf_counter() - start
+
+        # Should process 1000 alerts in <1 second
+        assert elapsed < 1.0
+        assert stats["total_alerts"] == 1000
 
 
 class TestAlertSummaryMain:
@@ -15,7 +15,12 @@ import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from scripts.generate_security_dashboard import generate_html_dashboard
+from scripts.generate_security_dashboard import (
+    calculate_statistics,
+    generate_html_dashboard,
+    load_audit_results,
+    load_historical_data,
+)
 
 
 def _generate_dashboard_from_json(json_path: Path, output_html: Path):
@@ -396,8 +401,6 @@ def test_dashboard_special_characters():
 
 def test_dashboard_empty_results():
     """Test dashboard generation with empty results list."""
-    from scripts.generate_security_dashboard import calculate_statistics, generate_html_dashboard
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard.html"
@@ -484,8 +487,6 @@ def test_dashboard_with_unknown_severity():
 
 def test_calculate_statistics_comprehensive():
     """Test calculate_statistics function with various scenarios."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     # Test comprehensive results with all statuses and severities
     results = [
         {"Status": "Pass", "Severity": "High"},
@@ -524,8 +525,6 @@ def test_calculate_statistics_comprehensive():
 
 def test_calculate_statistics_edge_cases():
     """Test calculate_statistics with edge cases."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     # Test empty results
     audit_statistics = calculate_statistics([])
     assert audit_statistics["total"] == 0
@@ -543,8 +542,6 @@ def test_calculate_statistics_edge_cases():
 
 def test_load_historical_data_with_valid_files():
     """Test loading historical data from timestamped JSON files."""
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -580,10 +577,6 @@ def test_load_historical_data_with_valid_files():
 
 def test_load_historical_data_with_invalid_json():
     """Test historical data loading with invalid JSON files."""
-    import json
-
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -606,8 +599,6 @@ def test_load_historical_data_with_invalid_json():
 
 def test_load_historical_data_with_invalid_filenames():
     """Test historical data loading with malformed filenames."""
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -623,10 +614,6 @@ def test_load_historical_data_with_invalid_filenames():
 
 def test_load_historical_data_limits_to_10_entries():
     """Test that historical data is limited to last 10 entries."""
-    import json
-
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -642,8 +629,6 @@ def test_load_historical_data_limits_to_10_entries():
 
 def test_load_historical_data_empty_directory():
     """Test historical data loading with no JSON files."""
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -654,10 +639,6 @@ def test_load_historical_data_empty_directory():
 
 def test_load_audit_results_with_bom():
     """Test loading audit results with UTF-8 BOM."""
-    import json
-
-    from scripts.generate_security_dashboard import load_audit_results
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -678,8 +659,6 @@ def test_load_audit_results_with_bom():
 @pytest.mark.skip(reason="load_json_with_bom raises exceptions, not handled gracefully")
 def test_load_audit_results_invalid_json():
     """Test loading invalid JSON handles errors gracefully."""
-    from scripts.generate_security_dashboard import load_audit_results
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -695,8 +674,6 @@ def test_load_audit_results_invalid_json():
 @pytest.mark.skip(reason="load_json_with_bom raises exceptions, not handled gracefully")
 def test_load_audit_results_missing_file():
     """Test loading non-existent file handles errors gracefully."""
-    from scripts.generate_security_dashboard import load_audit_results
-
     # Non-existent file
     results = load_audit_results(Path("nonexistent_file.json"))
     assert results is None or results == []
@@ -704,8 +681,6 @@ def test_load_audit_results_missing_file():
 
 def test_generate_html_dashboard_with_historical_data():
     """Test HTML generation includes trend chart when historical data exists."""
-    from scripts.generate_security_dashboard import calculate_statistics, generate_html_dashboard
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_with_trends.html"
@@ -735,8 +710,6 @@ def test_generate_html_dashboard_with_historical_data():
 
 def test_generate_html_dashboard_without_historical_data():
     """Test HTML generation hides trend chart when no historical data."""
-    from scripts.generate_security_dashboard import calculate_statistics, generate_html_dashboard
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_no_trends.html"
@@ -761,8 +734,6 @@ def test_generate_html_dashboard_without_historical_data():
 
 def test_generate_html_dashboard_sorting():
     """Test that controls are sorted by severity and status."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_sorted.html"
@@ -810,8 +781,6 @@ def test_generate_html_dashboard_sorting():
 
 def test_generate_html_dashboard_javascript_functions():
     """Test that JavaScript filtering functions are included."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_js.html"
@@ -833,8 +802,6 @@ def test_generate_html_dashboard_javascript_functions():
 
 def test_generate_html_dashboard_css_classes():
     """Test that appropriate CSS classes are applied."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_css.html"
@@ -861,8 +828,6 @@ def test_generate_html_dashboard_css_classes():
 
 def test_generate_html_dashboard_data_attributes():
     """Test that data attributes are set for filtering."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_data_attrs.html"
@@ -884,8 +849,6 @@ def test_generate_html_dashboard_data_attributes():
 
 def test_generate_html_dashboard_summary_cards():
     """Test that summary cards show correct statistics."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_summary.html"
@@ -916,8 +879,6 @@ def test_generate_html_dashboard_summary_cards():
 
 def test_calculate_statistics_pass_rate_calculation():
     """Test accurate pass rate calculation."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     # 7 pass out of 10 = 70%
     results = [{"Status": "Pass", "Severity": "High"}] * 7 + [{"Status": "Fail", "Severity": "High"}] * 3
 
@@ -929,8 +890,6 @@ def test_calculate_statistics_pass_rate_calculation():
 
 def test_calculate_statistics_rounding():
     """Test that rates are rounded to 2 decimal places."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     # 1 pass out of 3 = 33.33%
     results = [
         {"Status": "Pass", "Severity": "High"},
@@ -946,10 +905,6 @@ def test_calculate_statistics_rounding():
 
 def test_load_historical_data_timestamp_parsing_edge_cases():
     """Test historical data with various timestamp formats."""
-    import json
-
-    from scripts.generate_security_dashboard import load_historical_data
-
     with TemporaryDirectory() as td:
         td = Path(td)
 
@@ -971,8 +926,6 @@ def test_load_historical_data_timestamp_parsing_edge_cases():
 
 def test_generate_html_dashboard_chart_js_cdn():
     """Test that Chart.js CDN is included."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_chartjs.html"
@@ -994,8 +947,6 @@ def test_generate_html_dashboard_chart_js_cdn():
 
 def test_generate_html_dashboard_responsive_design():
     """Test that dashboard includes responsive meta tag."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_responsive.html"
@@ -1017,8 +968,6 @@ def test_generate_html_dashboard_responsive_design():
 
 def test_generate_html_dashboard_footer_content():
     """Test that footer includes remediation guidance."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_footer.html"
@@ -1040,8 +989,6 @@ def test_generate_html_dashboard_footer_content():
 
 def test_generate_html_dashboard_complete_structure():
     """Test that generated HTML has complete structure."""
-    from scripts.generate_security_dashboard import generate_html_dashboard, calculate_statistics
-
     with TemporaryDirectory() as td:
         td = Path(td)
         output_html = td / "dashboard_structure.html"
@@ -1075,8 +1022,6 @@ def test_generate_html_dashboard_complete_structure():
 
 def test_calculate_statistics_all_pass():
     """Test statistics when all controls pass."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     results = [
         {"Status": "Pass", "Severity": "High"},
         {"Status": "Pass", "Severity": "Medium"},
@@ -1093,8 +1038,6 @@ def test_calculate_statistics_all_pass():
 
 def test_calculate_statistics_all_fail():
     """Test statistics when all controls fail."""
-    from scripts.generate_security_dashboard import calculate_statistics
-
     results = [
         {"Status": "Fail", "Severity": "High"},
         {"Status": "Fail", "Severity": "Medium"},
@@ -7,6 +7,7 @@ These tests verify:
 - Plugin management tools (list_available_toolsets, load_toolset)
 """
 
+import asyncio
 import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -28,7 +29,7 @@ pytestmark = pytest.mark.skipif(not MCP_AVAILABLE, reason="MCP SDK not available
 
 
 if MCP_AVAILABLE:
-    from src.mcp.m365_mcp_server import M365MCPServer, PluginInfo
+    from src.mcp.m365_mcp_server import M365MCPServer, PluginInfo, _parse_entry_point
 
 
 class TestPluginInfo:
@@ -118,6 +119,7 @@ class TestM365MCPServerPluginDiscovery:
                 plugin = server._discovered_plugins["test_plugin"]
                 assert plugin.version == "1.0.0"
                 assert plugin.description == "A test plugin"
+                server.logger.info.assert_called_with("Discovered 1 plugins\n  test_plugin v1.0.0")
 
     def test_discover_plugins_skips_invalid_json(self):
         """Test that plugin discovery skips plugins with invalid JSON manifests."""
@@ -182,6 +184,32 @@ class TestM365MCPServerPluginDiscovery:
 
                 assert "__pycache__" not in server._discovered_plugins
 
+    def test_discover_plugins_applies_manifest_defaults(self):
+        """Test that optional manifest fields fall back to their defaults."""
+        with TemporaryDirectory() as tmpdir:
+            plugins_dir = Path(tmpdir) / "plugins"
+            test_plugin_dir = plugins_dir / "minimal_plugin"
+            test_plugin_dir.mkdir(parents=True)
+
+            # Manifest without any of the optional fields
+            (test_plugin_dir / "plugin.json").write_text("{}")
+
+            with patch.object(M365MCPServer, "__init__", lambda self: None):
+                server = M365MCPServer()
+                server.server = MagicMock()
+                server.logger = MagicMock()
+                server.plugins_path = plugins_dir
+                server._discovered_plugins = {}
+                server._loaded_plugins = set()
+
+                server._discover_plugins()
+
+                assert "minimal_plugin" in server._discovered_plugins
+                plugin = server._discovered_plugins["minimal_plugin"]
+                assert plugin.version == "0.0.0"
+                assert plugin.description == "No description"
+                assert plugin.entry_point == "tools:register_tools"
+
 
 class TestM365MCPServerPluginLoading:
     """Tests for plugin loading functionality."""
@@ -199,7 +227,7 @@ class TestM365MCPServerPluginLoading:
             # from mcp import McpError
 
             with pytest.raises(McpError) as exc_info:
-                server._load_plugin("nonexistent_plugin")
+                asyncio.run(server._load_plugin("nonexistent_plugin"))
 
             assert "Plugin not found" in str(exc_info.value)
 
@@ -219,8 +247,9 @@ class TestM365MCPServerPluginLoading:
                 )
             }
             server._loaded_plugins = {"test_plugin"}
+            server._load_locks = {}
 
-            result = server._load_plugin("test_plugin")
+            result = asyncio.run(server._load_plugin("test_plugin"))
 
             assert "already loaded" in result
 
@@ -240,14 +269,61 @@ class TestM365MCPServerPluginLoading:
                 )
             }
             server._loaded_plugins = set()
+            server._load_locks = {}
 
             # from mcp import McpError
 
             with pytest.raises(McpError) as exc_info:
-                server._load_plugin("test_plugin")
+                asyncio.run(server._load_plugin("test_plugin"))
 
             assert "Invalid entry_point format" in str(exc_info.value)
 
+    def test_parse_entry_point(self):
+        """Test entry point parsing for valid and malformed values."""
+        assert _parse_entry_point("tools:register_tools") == ("tools", "register_tools")
+
+        for invalid in ("invalid_entry_point", "a:b:c"):
+            with pytest.raises(ValueError):
+                _parse_entry_point(invalid)
+
+    def test_load_plugin_concurrent_calls_register_once(self):
+        """Test that concurrent loads of the same plugin only register it once."""
+        with patch.object(M365MCPServer, "__init__", lambda self: None):
+            server = M365MCPServer()
+            server.server = MagicMock()
+            server.logger = MagicMock()
+            server.toolkit_path = Path("/tmp")
+            server._discovered_plugins = {
+                "test_plugin": PluginInfo(
+                    name="test_plugin",
+                    version="1.0.0",
+                    description="Test",
+                    entry_point="tools:register_tools",
+                    path=Path("/tmp"),
+                )
+            }
+            server._loaded_plugins = set()
+            server._load_locks = {}
+
+            calls = []
+
+            async def register_tools(mcp_server, toolkit_path):
+                calls.append((mcp_server, toolkit_path))
+                # Yield inside the critical section so an unlocked second load could race in
+                await asyncio.sleep(0)
+
+            module = MagicMock(register_tools=register_tools)
+            with patch("src.mcp.m365_mcp_server.importlib.import_module", return_value=module):
+
+                async def load_twice():
+                    return await asyncio.gather(server._load_plugin("test_plugin"), server._load_plugin("test_plugin"))
+
+                results = asyncio.run(load_twice())
+
+            assert calls == [(server.server, server.toolkit_path)]
+            assert "Successfully loaded" in results[0]
+            assert "already loaded" in results[1]
+
 
 class TestM365MCPServerIntegration:
     """Integration tests for the M365 MCP Server."""
@@ -28,6 +28,13 @@ def mock_azure_credential():
         yield mock_cred, mock_token
 
 
+@pytest.fixture
+def gpt5_client():
+    # For tests that stub out the client's own methods and never touch the SDK mock
+    with patch("src.integrations.openai_gpt5.OpenAI"):
+        yield GPT5Client(azure_endpoint="https://test.openai.azure.com", api_key="test-key")
+
+
 class TestGPT5Client:
 
     def test_init_api_key(self, mock_env, mock_openai_client):
@@ -86,35 +93,32 @@ class TestGPT5Client:
         call_kwargs = client.client.responses.create.call_args[1]
         assert call_kwargs["reasoning"]["effort"] == "high"
 
-    def test_analyze_financial_document(self, mock_env, mock_openai_client):
-        client = GPT5Client()
+    def test_analyze_financial_document(self, gpt5_client):
         # Mock reasoning_response since analyze_financial_document calls it
-        with patch.object(client, "reasoning_response") as mock_reasoning:
+        with patch.object(gpt5_client, "reasoning_response") as mock_reasoning:
             mock_reasoning.return_value = {"output_text": "Analysis result"}
 
-            result = client.analyze_financial_document("Doc text", analysis_type="audit")
+            result = gpt5_client.analyze_financial_document("Doc text", analysis_type="audit")
 
             assert result["output_text"] == "Analysis result"
             mock_reasoning.assert_called_once()
             call_kwargs = mock_reasoning.call_args[1]
             assert "senior auditor" in call_kwargs["prompt"]
 
-    def test_generate_client_report_summary(self, mock_env, mock_openai_client):
-        client = GPT5Client()
-        with patch.object(client, "chat_completion") as mock_chat:
+    def test_generate_client_report_summary(self, gpt5_client):
+        with patch.object(gpt5_client, "chat_completion") as mock_chat:
             mock_chat.return_value = {"choices": [{"message": {"content": "Summary"}}]}
 
-            result = client.generate_client_report_summary("Client data")
+            result = gpt5_client.generate_client_report_summary("Client data")
 
             assert result["choices"][0]["message"]["content"] == "Summary"
             mock_chat.assert_called_once()
 
-    def test_draft_engagement_letter(self, mock_env, mock_openai_client):
-        client = GPT5Client()
-        with patch.object(client, "chat_completion") as mock_chat:
+    def test_draft_engagement_letter(self, gpt5_client):
+        with patch.object(gpt5_client, "chat_completion") as mock_chat:
             mock_chat.return_value = {"choices": [{"message": {"content": "Letter"}}]}
 
-            result = client.draft_engagement_letter("Client A", "Audit", "Scope", "Fees")
+            result = gpt5_client.draft_engagement_letter("Client A", "Audit", "Scope", "Fees")
 
             assert result["choices"][0]["message"]["content"] == "Letter"
             mock_chat.assert_called_once()
@@ -10,10 +10,6 @@ import csv
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import pytest
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_benchmark_script_imports():